@@ -0,0 +1,52 @@
+"""
+Single entry point dispatching to the GitLab mirroring subcommands.
+
+Usage:
+    gitlab-mirror [mirror options]
+    gitlab-mirror <command> [command options]
+
+Only the module of the selected command is imported, so running one command
+does not pay for loading the others.
+"""
+
+import importlib
+import os
+import sys
+from typing import Optional, Sequence
+
+# Subcommand name -> module providing a main(argv) entry point
+COMMANDS = {
+    "mirror": "gitlab_mirror.cli.main",
+    "verify": "gitlab_mirror.cli.commands.verify_command",
+    "update": "gitlab_mirror.cli.commands.update_command",
+    "trigger": "gitlab_mirror.cli.commands.trigger_command",
+    "remove": "gitlab_mirror.cli.commands.remove_command",
+    "batch-remove": "gitlab_mirror.cli.commands.batch_remove_command",
+}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Dispatch to the selected subcommand.
+
+    Without a known subcommand name as the first argument, all arguments are
+    passed to the mirror command, matching the original gitlab-mirror behavior.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    name = "mirror"
+    prog = None
+    if argv and argv[0] in COMMANDS:
+        name = argv.pop(0)
+        # Usage and errors then show the full command, e.g. "gitlab-mirror verify"
+        prog = f"{os.path.basename(sys.argv[0])} {name}"
+
+    module = importlib.import_module(COMMANDS[name])
+    module.main(argv, prog=prog)
+
+
+if __name__ == "__main__":
+    main()
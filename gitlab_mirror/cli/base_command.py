@@ -3,28 +3,98 @@ Base command utilities for standardizing CLI interfaces.
 """
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-import traceback
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from dotenv import load_dotenv
-
-from gitlab_mirror.core.config import get_env_variable
+from gitlab_mirror.core.config import get_env_variable, load_env_once
 from gitlab_mirror.core.exceptions import ConfigError, MirrorError
 
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+# Destination -> (environment variable, fallback) used for options left unset.
+# Resolved after parsing so explicit flags and --help never read the environment.
+ENV_DEFAULTS: Dict[str, Tuple[str, Optional[str]]] = {
+    "source_url": ("SOURCE_GITLAB_URL", None),
+    "source_token": ("SOURCE_GITLAB_TOKEN", None),
+    "target_url": ("TARGET_GITLAB_URL", None),
+    "target_token": ("TARGET_GITLAB_TOKEN", None),
+    "projects_file": ("PROJECTS_FILE", "projects.csv"),
+}
+
+# Required-argument sets shared by the commands, for BaseCommand.require
+SOURCE_CONNECTION_ARGS = ("source-url", "source-token")
+CONNECTION_ARGS = SOURCE_CONNECTION_ARGS + ("target-url", "target-token")
+
+# Listener owning the real output handler; installed once per process
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(level: int = logging.INFO) -> None:
     """
     Configure logging for the application with a standardized format.
 
+    Log records are put on a queue and written to stderr by a background
+    QueueListener, so logging calls in the command loops never block on I/O.
+    Calling this again only changes the root logger level.
+
     Args:
         level: Logging level (default: INFO)
     """
-    logging.basicConfig(
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        level=level,
+    global _log_listener  # pylint: disable=global-statement
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+
+    if _log_listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
     )
+    _log_listener.start()
+    # Stop the listener at exit so queued records are flushed before shutdown
+    atexit.register(_log_listener.stop)
+
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def run_with_error_handling(command_func: Callable, *args, **kwargs) -> None:
+    """
+    Run a command function, mapping failures to the standard exit codes.
+
+    Exit codes:
+        1 - Configuration error
+        2 - Mirror operation error
+        3 - Unexpected error
+
+    Args:
+        command_func: Function to run
+        *args: Positional arguments for the command function
+        **kwargs: Keyword arguments for the command function
+    """
+    try:
+        command_func(*args, **kwargs)
+    except ConfigError as e:
+        logging.error("Configuration error: %s", e)
+        sys.exit(1)
+    except MirrorError as e:
+        logging.error("Mirror operation failed: %s", e)
+        sys.exit(2)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logging.error("Unexpected error: %s", e)
+        import traceback  # pylint: disable=import-outside-toplevel
+
+        traceback.print_exc()
+        sys.exit(3)
 
 
 class BaseCommand:
@@ -35,6 +105,7 @@ class BaseCommand:
         description: str,
         epilog: Optional[str] = None,
         formatter_class: Any = argparse.RawDescriptionHelpFormatter,
+        prog: Optional[str] = None,
     ):
         """
         Initialize the base command.
@@ -43,16 +114,17 @@ class BaseCommand:
             description: Command description for help text
             epilog: Optional epilog text for help output
             formatter_class: Argument parser formatter class
+            prog: Program name shown in usage and errors (default: from sys.argv[0])
         """
-        # Setup logging
-        setup_logging()
+        # Environment fallbacks applied to unset options in parse_args
+        self.env_defaults = dict(ENV_DEFAULTS)
 
-        # Load environment variables
-        load_dotenv()
+        # Options that must have a value once environment fallbacks are applied
+        self.required_args: List[str] = []
 
         # Create parser
         self.parser = argparse.ArgumentParser(
-            description=description, epilog=epilog, formatter_class=formatter_class
+            prog=prog, description=description, epilog=epilog, formatter_class=formatter_class
         )
 
         # Add common argument groups
@@ -67,44 +139,76 @@ class BaseCommand:
         """Add standard arguments that apply to most commands."""
         self.connection_group.add_argument(
             "--source-url",
+            "--gitlab-url",
+            dest="source_url",
             help="Source GitLab URL (default: from SOURCE_GITLAB_URL env var)",
-            default=get_env_variable("SOURCE_GITLAB_URL"),
         )
         self.connection_group.add_argument(
             "--source-token",
+            "--token",
+            dest="source_token",
             help="Source GitLab token (default: from SOURCE_GITLAB_TOKEN env var)",
-            default=get_env_variable("SOURCE_GITLAB_TOKEN"),
         )
 
         self.debug_group.add_argument("--debug", help="Enable debug logging", action="store_true")
 
-    def add_target_connection_args(self) -> None:
-        """Add target connection arguments for commands that need them."""
-        self.connection_group.add_argument(
-            "--target-url",
-            help="Target GitLab URL (default: from TARGET_GITLAB_URL env var)",
-            default=get_env_variable("TARGET_GITLAB_URL"),
-        )
+    def add_target_connection_args(self, include_url: bool = True) -> None:
+        """
+        Add target connection arguments for commands that need them.
+
+        Args:
+            include_url: Whether to add --target-url (commands that only push
+                with the target token can leave it out)
+        """
+        if include_url:
+            self.connection_group.add_argument(
+                "--target-url",
+                help="Target GitLab URL (default: from TARGET_GITLAB_URL env var)",
+            )
         self.connection_group.add_argument(
             "--target-token",
             help="Target GitLab token (default: from TARGET_GITLAB_TOKEN env var)",
-            default=get_env_variable("TARGET_GITLAB_TOKEN"),
         )
 
-    def add_projects_file_arg(self, required: bool = False) -> None:
+    def add_projects_file_arg(self, required: bool = False, aliases: Sequence[str] = ()) -> None:
         """
         Add projects file argument to the parser.
 
         Args:
             required: Whether the argument is required
+            aliases: Additional option strings accepted for the argument
         """
         self.parser.add_argument(
             "--projects-file",
+            *aliases,
+            dest="projects_file",
             help="CSV file with project mappings (default: from PROJECTS_FILE env var)",
-            default=get_env_variable("PROJECTS_FILE", required=False) or "projects.csv",
             required=required,
         )
 
+    def add_env_default(self, dest: str, env_var: str, fallback: Optional[str] = None) -> None:
+        """
+        Register an environment variable used when an option is not given.
+
+        Args:
+            dest: Destination name of the option
+            env_var: Environment variable to read
+            fallback: Value used when the environment variable is unset
+        """
+        self.env_defaults[dest] = (env_var, fallback)
+
+    def require(self, *names: str) -> None:
+        """
+        Mark options as required, checked in parse_args after environment fallbacks.
+
+        argparse's own required=True can't be used for these options, since
+        their value may come from the environment instead of the command line.
+
+        Args:
+            *names: Option names (flag spelling without leading dashes)
+        """
+        self.required_args.extend(names)
+
     def add_dry_run_arg(self) -> None:
         """Add dry run argument to the parser."""
         self.behavior_group.add_argument(
@@ -114,40 +218,53 @@ class BaseCommand:
             default=False,
         )
 
-    def parse_args(self) -> argparse.Namespace:
+    def parse_args(self, argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         """
         Parse command line arguments.
 
+        Logging and the .env file are only set up once parsing succeeds, so
+        --help and usage errors exit without touching either.
+
+        Args:
+            argv: Arguments to parse (default: sys.argv[1:])
+
         Returns:
             Parsed command line arguments
         """
-        args = self.parser.parse_args()
+        args = self.parser.parse_args(argv)
+
+        # Setup logging, with debug output if requested
+        setup_logging(logging.DEBUG if args.debug else logging.INFO)
+
+        # Load environment variables
+        load_env_once()
+
+        # Fill in options left unset from the environment
+        for dest, (env_var, fallback) in self.env_defaults.items():
+            if dest in vars(args) and getattr(args, dest) is None:
+                setattr(args, dest, get_env_variable(env_var) or fallback)
 
-        # Enable debug logging if requested
-        if args.debug:
-            setup_logging(logging.DEBUG)
+        self.verify_required_args(args, self.required_args)
 
         return args
 
-    def verify_required_args(self, args: argparse.Namespace, required_args: List[str]) -> None:
+    def verify_required_args(self, args: argparse.Namespace, required_args: Sequence[str]) -> None:
         """
         Verify required arguments are present.
 
         Args:
             args: Parsed command line arguments
-            required_args: List of required argument names
+            required_args: Required argument names (flag spelling without leading dashes)
 
         Raises:
             SystemExit: If any required arguments are missing
         """
-        missing = []
-        for arg_name in required_args:
-            if not getattr(args, arg_name.replace("-", "_")):
-                missing.append(arg_name)
+        values = vars(args)
+        missing = [name for name in required_args if not values.get(name.replace("-", "_"))]
 
         if missing:
+            # parser.error() exits with status 2
             self.parser.error(f"Missing required arguments: {', '.join(missing)}")
-            sys.exit(1)
 
     def run_command(self, command_func: Callable, *args, **kwargs) -> None:
         """
@@ -158,15 +275,4 @@ class BaseCommand:
             *args: Positional arguments for the command function
             **kwargs: Keyword arguments for the command function
         """
-        try:
-            command_func(*args, **kwargs)
-        except ConfigError as e:
-            logging.error("Configuration error: %s", e)
-            sys.exit(1)
-        except MirrorError as e:
-            logging.error("Mirror operation failed: %s", e)
-            sys.exit(2)
-        except Exception as e:
-            logging.error("Unexpected error: %s", e)
-            traceback.print_exc()
-            sys.exit(3)
+        run_with_error_handling(command_func, *args, **kwargs)
@@ -5,42 +5,17 @@ This module provides the CLI command for removing GitLab push mirrors
 for projects specified in a CSV file.
 """
 
-import argparse
+import csv
+import functools
 import logging
 import sys
-import traceback
+from typing import Optional, Sequence
 
-from dotenv import load_dotenv
-
-from gitlab_mirror.core.config import get_env_variable
-from gitlab_mirror.core.exceptions import ConfigError, MirrorError
-from gitlab_mirror.utils.batch_remove import remove_mirrors_from_csv
+from gitlab_mirror.cli.base_command import SOURCE_CONNECTION_ARGS, BaseCommand
 
 logger = logging.getLogger(__name__)
 
-
-def setup_logging(level=logging.INFO):
-    """Configure logging for the application."""
-    logging.basicConfig(
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        level=level,
-    )
-
-
-def main():
-    """Main entry point for the batch remove command."""
-    # Setup logging
-    setup_logging()
-
-    # Load environment variables
-    load_dotenv()
-
-    # Create a more descriptive argument parser with examples and formatting
-
-
-parser = argparse.ArgumentParser(
-    description="Remove push mirrors for projects specified in a CSV file.",
-    epilog="""
+_EPILOG = """
 Examples:
     gitlab-mirror-batch-remove --csv-file=projects.csv
     gitlab-mirror-batch-remove --csv-file=projects.csv --dry-run
@@ -71,109 +46,86 @@ Use Cases:
 Related Commands:
     gitlab-mirror-remove       Remove mirrors by pattern or status
     gitlab-mirror-verify       Generate lists of projects needing attention
-    """,
-    formatter_class=argparse.RawDescriptionHelpFormatter,
-)
-
-# Group connection arguments
-connection_group = parser.add_argument_group("GitLab Connection")
-connection_group.add_argument(
-    "--gitlab-url",
-    help="GitLab URL (default: from SOURCE_GITLAB_URL env var)",
-    default=get_env_variable("SOURCE_GITLAB_URL"),
-)
-connection_group.add_argument(
-    "--token",
-    help="GitLab token (default: from SOURCE_GITLAB_TOKEN env var)",
-    default=get_env_variable("SOURCE_GITLAB_TOKEN"),
-)
-
-# Group input arguments
-input_group = parser.add_argument_group("Input")
-input_group.add_argument(
-    "--csv-file",
-    help="CSV file with project paths (default: from PROJECTS_FILE env var)",
-    default=get_env_variable("PROJECTS_FILE", required=False) or "projects.csv",
-)
-
-# Group behavior arguments
-behavior_group = parser.add_argument_group("Behavior")
-behavior_group.add_argument(
-    "--dry-run",
-    help="Only show what would be removed, don't actually remove",
-    action="store_true",
-    default=False,
-)
-
-# Debug options
-debug_group = parser.add_argument_group("Debug Options")
-debug_group.add_argument("--debug", help="Enable debug logging", action="store_true")
-
-args = parser.parse_args()
-
-# Enable debug logging if requested
-if args.debug:
-    setup_logging(logging.DEBUG)
-
-# Check for required arguments
-missing = []
-if not args.gitlab_url:
-    missing.append("gitlab-url")
-if not args.token:
-    missing.append("token")
-if not args.csv_file:
-    missing.append("csv-file")
-
-if missing:
-    parser.error(f"Missing required arguments: {', '.join(missing)}")
-
-try:
-    # Call the utility function
-    result = remove_mirrors_from_csv(
-        gitlab_url=args.gitlab_url,
-        private_token=args.token,
-        csv_file=args.csv_file,
-        dry_run=args.dry_run,
+    """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_command(prog: Optional[str] = None) -> BaseCommand:
+    """Build the batch remove parser once; repeated main() calls reuse it."""
+    cmd = BaseCommand(
+        prog=prog,
+        description="Remove push mirrors for projects specified in a CSV file.",
+        epilog=_EPILOG,
     )
+    cmd.add_projects_file_arg(aliases=("--csv-file",))
+    cmd.add_dry_run_arg()
+    cmd.require(*SOURCE_CONNECTION_ARGS, "projects-file")
+
+    return cmd
+
+
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    """
+    Main entry point for the batch remove command.
 
-    # Print summary
-    print("\n===== BATCH MIRROR REMOVAL SUMMARY =====")
-    print(f"Total projects in CSV: {result['total_projects_in_csv']}")
-    print(f"Projects processed: {result['processed_projects']}")
-    print(f"Projects skipped (not found): {result['skipped_projects']}")
-
-    if args.dry_run:
-        print(f"Mirrors that would be removed: {result['would_remove']}")
-    else:
-        print(f"Mirrors removed: {result['mirrors_removed']}")
-
-    if result["failed_projects"]:
-        print("\nFailed operations:")
-        for project in result["failed_projects"][:5]:
-            print(f" - {project['project']}: {project['error']}")
-        if len(result["failed_projects"]) > 5:
-            print(f"  ... and {len(result['failed_projects']) - 5} more")
-
-        # Export failed projects to CSV
-        with open("batch-remove-failed.csv", "w", encoding="utf-8") as f:
-            f.write("project,error\n")
-            for failed in result["failed_projects"]:
-                SANITIZED_ERROR = str(failed["error"]).replace(",", ";")
-                f.write(f"{failed['project']}, {SANITIZED_ERROR}\n")
-        print(
-            f"Exported {len(result['failed_projects'])} failed projects to batch-remove-failed.csv"
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        prog: Program name for usage and error messages (default: from sys.argv[0])
+    """
+    cmd = _build_command(prog)
+    args = cmd.parse_args(argv)
+
+    # Deferred so --help and usage errors don't import python-gitlab
+    from gitlab_mirror.utils.batch_remove import (  # pylint: disable=import-outside-toplevel
+        remove_mirrors_from_csv,
+    )
+
+    def _run():
+        # Call the utility function
+        result = remove_mirrors_from_csv(
+            gitlab_url=args.source_url,
+            private_token=args.source_token,
+            csv_file=args.projects_file,
+            dry_run=args.dry_run,
         )
 
-except ConfigError as e:
-    logger.error("Configuration error: %s", e)
-    sys.exit(1)
-except MirrorError as e:
-    logger.error("Mirror operation failed: %s", e)
-    sys.exit(2)
-except Exception as e:  # pylint: disable=broad-exception-caught
-    logger.error("Unexpected error: %s", e)
-    traceback.print_exc()
-    sys.exit(3)
+        # Print summary
+        failed_projects = result["failed_projects"]
+        lines = [
+            "",
+            "===== BATCH MIRROR REMOVAL SUMMARY =====",
+            f"Total projects in CSV: {result['total_projects_in_csv']}",
+            f"Projects processed: {result['processed_projects']}",
+            f"Projects skipped (not found): {result['skipped_projects']}",
+        ]
+
+        if args.dry_run:
+            lines.append(f"Mirrors that would be removed: {result['would_remove']}")
+        else:
+            lines.append(f"Mirrors removed: {result['mirrors_removed']}")
+
+        if failed_projects:
+            lines.append("\nFailed operations:")
+            lines.extend(
+                f" - {project['project']}: {project['error']}" for project in failed_projects[:5]
+            )
+            if len(failed_projects) > 5:
+                lines.append(f"  ... and {len(failed_projects) - 5} more")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        if failed_projects:
+            # Export failed projects to CSV
+            with open("batch-remove-failed.csv", "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("project", "error"))
+                writer.writerows(
+                    (failed["project"], str(failed["error"])) for failed in failed_projects
+                )
+            print(f"Exported {len(failed_projects)} failed projects to batch-remove-failed.csv")
+
+    cmd.run_command(_run)
+
 
 if __name__ == "__main__":
     main()
@@ -8,13 +8,9 @@ in a CSV file.
 
 import logging
 import sys
-import traceback
-from pathlib import Path
-
-from pydantic import SecretStr
 
+from gitlab_mirror.cli.base_command import run_with_error_handling
 from gitlab_mirror.core.config import GitLabConfig, MirrorConfig
-from gitlab_mirror.core.exceptions import ConfigError, MirrorError
 from gitlab_mirror.core.mirror import MirrorService
 
 logger = logging.getLogger(__name__)
@@ -71,39 +67,53 @@ def mirror_command(
         2 - Mirror operation error
         3 - Unexpected error
     """
-    # Print initialization message
-    print("Initializing GitLab mirror with:")
-    print(f"  Source: {source_url}")
-    print(f"  Target: {target_url}")
-    print(f"  Projects file: {projects_file}")
-    print(f"  Assign users: {assign_users}")
-
-    try:
-        config = MirrorConfig(
-            source=GitLabConfig(url=source_url, token=SecretStr(source_token)),
-            target=GitLabConfig(url=target_url, token=SecretStr(target_token)),
-            projects_file=Path(projects_file),
-            assign_users=assign_users,
-        )
-
-        service = MirrorService(config)
-        success, failures = service.mirror_all_projects()
-
-        print("\n===== MIRROR SUMMARY =====")
-        print(f"Total projects: {success + failures}")
-        print(f"Successfully mirrored: {success}")
-        print(f"Failed: {failures}")
-
-        if failures > 0:
-            print("\nCheck logs for details on failures.")
-
-    except ConfigError as e:
-        print(f"Configuration error: {e}")
-        sys.exit(1)
-    except MirrorError as e:
-        print(f"Mirror operation failed: {e}")
-        sys.exit(2)
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        print(f"Unexpected error: {e}")
-        traceback.print_exc()
-        sys.exit(3)
+    logger.info(
+        "Initializing GitLab mirror: source=%s target=%s projects_file=%s assign_users=%s",
+        source_url,
+        target_url,
+        projects_file,
+        assign_users,
+    )
+
+    run_with_error_handling(
+        _run_mirror,
+        source_url=source_url,
+        source_token=source_token,
+        target_url=target_url,
+        target_token=target_token,
+        projects_file=projects_file,
+        assign_users=assign_users,
+    )
+
+
+def _run_mirror(
+    source_url: str,
+    source_token: str,
+    target_url: str,
+    target_token: str,
+    projects_file: str,
+    assign_users: bool,
+) -> None:
+    """Build the configuration and mirror every project in the projects file."""
+    config = MirrorConfig(
+        source=GitLabConfig(url=source_url, token=source_token),
+        target=GitLabConfig(url=target_url, token=target_token),
+        projects_file=projects_file,
+        assign_users=assign_users,
+    )
+
+    service = MirrorService(config)
+    success, failures = service.mirror_all_projects()
+
+    lines = [
+        "",
+        "===== MIRROR SUMMARY =====",
+        f"Total projects: {success + failures}",
+        f"Successfully mirrored: {success}",
+        f"Failed: {failures}",
+    ]
+
+    if failures > 0:
+        lines.append("\nCheck logs for details on failures.")
+
+    sys.stdout.write("\n".join(lines) + "\n")
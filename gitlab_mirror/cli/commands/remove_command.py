@@ -5,40 +5,18 @@ This module provides the CLI command for removing GitLab push mirrors
 based on specified criteria such as URL pattern matching or failure status.
 """
 
-import argparse
+import functools
 import logging
+import re
 import sys
-import traceback
+from typing import Optional, Sequence
 
-from dotenv import load_dotenv
-
-from gitlab_mirror.core.config import get_env_variable
-from gitlab_mirror.core.exceptions import ConfigError, MirrorError
-from gitlab_mirror.utils.remove import remove_mirrors
+from gitlab_mirror.cli.base_command import SOURCE_CONNECTION_ARGS, BaseCommand
+from gitlab_mirror.core.config import env_bool
 
 logger = logging.getLogger(__name__)
 
-
-def setup_logging(level=logging.INFO):
-    """Configure logging for the application."""
-    logging.basicConfig(
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        level=level,
-    )
-
-
-def main():
-    """Main entry point for the remove command."""
-    # Setup logging
-    setup_logging()
-
-    # Load environment variables
-    load_dotenv()
-
-    # Parse command line arguments with enhanced help
-    parser = argparse.ArgumentParser(
-        description="Remove push mirrors from GitLab projects based on specified criteria.",
-        epilog="""
+_EPILOG = """
 Examples:
     gitlab-mirror-remove --pattern="old-domain.com"
     gitlab-mirror-remove --remove-failed
@@ -53,35 +31,29 @@ Environment Variables:
 Warning:
     Removing mirrors is irreversible. Use --dry-run to preview changes.
     The --all flag will remove ALL mirrors from ALL projects - use with caution!
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+        """
 
-    # Group connection arguments
-    connection_group = parser.add_argument_group("GitLab Connection")
-    connection_group.add_argument(
-        "--gitlab-url",
-        help="GitLab URL (default: from SOURCE_GITLAB_URL env var)",
-        default=get_env_variable("SOURCE_GITLAB_URL"),
-    )
-    connection_group.add_argument(
-        "--token",
-        help="GitLab token (default: from SOURCE_GITLAB_TOKEN env var)",
-        default=get_env_variable("SOURCE_GITLAB_TOKEN"),
+
+@functools.lru_cache(maxsize=1)
+def _build_command(prog: Optional[str] = None) -> BaseCommand:
+    """Build the remove parser once; repeated main() calls reuse it."""
+    cmd = BaseCommand(
+        prog=prog,
+        description="Remove push mirrors from GitLab projects based on specified criteria.",
+        epilog=_EPILOG,
     )
 
     # Group selection criteria
-    selection_group = parser.add_argument_group("Selection Criteria (at least one required)")
+    selection_group = cmd.parser.add_argument_group("Selection Criteria (at least one required)")
     selection_group.add_argument(
         "--pattern",
         help="Regex pattern to match mirror URLs (default: from MIRROR_PATTERN env var)",
-        default=get_env_variable("MIRROR_PATTERN", required=False),
     )
     selection_group.add_argument(
         "--remove-failed",
         help="Remove mirrors with errors (default: from REMOVE_FAILED_MIRRORS env var)",
         action="store_true",
-        default=get_env_variable("REMOVE_FAILED_MIRRORS", required=False) == "true",
+        default=None,
     )
     selection_group.add_argument(
         "--all",
@@ -90,36 +62,33 @@ Warning:
         default=False,
     )
 
-    # Group behavior options
-    behavior_group = parser.add_argument_group("Behavior")
-    behavior_group.add_argument(
-        "--dry-run",
-        help="Only show what would be removed, don't actually remove",
-        action="store_true",
-        default=False,
-    )
+    cmd.add_dry_run_arg()
+    cmd.add_env_default("pattern", "MIRROR_PATTERN")
+    cmd.require(*SOURCE_CONNECTION_ARGS)
 
-    # Debug options
-    debug_group = parser.add_argument_group("Debug Options")
-    debug_group.add_argument("--debug", help="Enable debug logging", action="store_true")
+    return cmd
 
-    args = parser.parse_args()
 
-    # Enable debug logging if requested
-    if args.debug:
-        setup_logging(logging.DEBUG)
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    """
+    Main entry point for the remove command.
 
-    pattern = args.pattern
-    if pattern and not pattern.startswith("^") and not pattern.endswith("$"):
-        # If pattern is plain text, escape dots for regex
-        pattern = pattern.replace(".", "\\.")
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        prog: Program name for usage and error messages (default: from sys.argv[0])
+    """
+    cmd = _build_command(prog)
+    args = cmd.parse_args(argv)
+    if args.remove_failed is None:
+        args.remove_failed = env_bool("REMOVE_FAILED_MIRRORS")
 
-    # Check for required arguments
-    missing = []
-    if not args.gitlab_url:
-        missing.append("gitlab-url")
-    if not args.token:
-        missing.append("token")
+    # Compile the pattern once; it is matched against every mirror URL
+    pattern = None
+    if args.pattern:
+        try:
+            pattern = re.compile(args.pattern, re.IGNORECASE)
+        except re.error as e:
+            cmd.parser.error(f"Invalid --pattern regex {args.pattern!r}: {e}")
 
     # Check to see if at least one mirrored selection condition is given
     if not args.pattern and not args.remove_failed and not args.all:
@@ -129,10 +98,10 @@ Warning:
         logger.error("You can also set MIRROR_PATTERN or REMOVE_FAILED_MIRRORS in your .env file")
         sys.exit(1)
 
-    if missing:
-        parser.error(f"Missing required arguments: {', '.join(missing)}")
+    # Deferred so --help and usage errors don't import python-gitlab
+    from gitlab_mirror.utils.remove import remove_mirrors  # pylint: disable=import-outside-toplevel
 
-    try:
+    def _run():
         if args.dry_run:
             print(
                 "DRY RUN MODE: No mirrors will be removed. Run without --dry-run to remove mirrors."
@@ -148,9 +117,9 @@ Warning:
 
             # Call the function in dry-run mode to display statistics
             result = remove_mirrors(
-                gitlab_url=args.gitlab_url,
-                private_token=args.token,
-                pattern=args.pattern,
+                gitlab_url=args.source_url,
+                private_token=args.source_token,
+                pattern=pattern,
                 remove_failed=args.remove_failed,
                 remove_all=args.all,
                 dry_run=True,
@@ -177,7 +146,7 @@ Warning:
             if args.remove_failed:
                 action_description.append("failed mirrors")
 
-            print(f"Removing {' and '.join(action_description)} from {args.gitlab_url}")
+            print(f"Removing {' and '.join(action_description)} from {args.source_url}")
             confirmation = input(
                 "Are you sure you want to remove these mirrors? This cannot be undone. (yes/no): "
             )
@@ -187,37 +156,35 @@ Warning:
 
         # Run the remove operation
         result = remove_mirrors(
-            gitlab_url=args.gitlab_url,
-            private_token=args.token,
-            pattern=args.pattern,
+            gitlab_url=args.source_url,
+            private_token=args.source_token,
+            pattern=pattern,
             remove_failed=args.remove_failed,
             remove_all=args.all,
         )
 
         # Print summary
-        print("\n===== MIRROR REMOVAL SUMMARY =====")
-        print(f"Total projects processed: {result['processed_projects']}")
-        print(f"Projects with mirrors: {result['projects_with_mirrors']}")
-        print(f"Mirrors removed: {result['mirrors_removed']}")
-        print(f"Errors encountered: {result['errors']}")
-
-        if result["failed_projects"]:
-            print("\nFailed projects:")
-            for project in result["failed_projects"][:5]:
-                print(f" - {project['project']}: {project['error']}")
-            if len(result["failed_projects"]) > 5:
-                print(f"  ... and {len(result['failed_projects']) - 5} more")
-
-    except ConfigError as e:
-        logger.error("Configuration error: %s", e)
-        sys.exit(1)
-    except MirrorError as e:
-        logger.error("Mirror operation failed: %s", e)
-        sys.exit(2)
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error("Unexpected error: %s", e)
-        traceback.print_exc()
-        sys.exit(3)
+        failed_projects = result["failed_projects"]
+        lines = [
+            "",
+            "===== MIRROR REMOVAL SUMMARY =====",
+            f"Total projects processed: {result['processed_projects']}",
+            f"Projects with mirrors: {result['projects_with_mirrors']}",
+            f"Mirrors removed: {result['mirrors_removed']}",
+            f"Errors encountered: {result['errors']}",
+        ]
+
+        if failed_projects:
+            lines.append("\nFailed projects:")
+            lines.extend(
+                f" - {project['project']}: {project['error']}" for project in failed_projects[:5]
+            )
+            if len(failed_projects) > 5:
+                lines.append(f"  ... and {len(failed_projects) - 5} more")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    cmd.run_command(_run)
 
 
 if __name__ == "__main__":
@@ -6,40 +6,15 @@ for existing projects. It allows batch processing of projects and controls the
 synchronization rate to avoid overloading the GitLab server.
 """
 
-import argparse
+import functools
 import logging
-import sys
-import traceback
+from typing import Optional, Sequence
 
-from dotenv import load_dotenv
-
-from gitlab_mirror.core.config import get_env_variable
-from gitlab_mirror.core.exceptions import ConfigError, MirrorError
-from gitlab_mirror.utils.trigger import process_file  # Import from existing trigger.py
+from gitlab_mirror.cli.base_command import BaseCommand
 
 logger = logging.getLogger(__name__)
 
-
-def setup_logging(level=logging.INFO):
-    """Configure logging for the application."""
-    logging.basicConfig(
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        level=level,
-    )
-
-
-def main():
-    """Main entry point for the trigger command."""
-    # Setup logging
-    setup_logging()
-
-    # Load environment variables
-    load_dotenv()
-
-    # Parse command line arguments with enhanced help
-    parser = argparse.ArgumentParser(
-        description="Trigger synchronization for existing GitLab push mirrors",
-        epilog="""
+_EPILOG = """
 Examples:
     gitlab-mirror-trigger --projects-file=projects.csv
     gitlab-mirror-trigger --projects-file=fix-list.csv --batch-size=10 --delay=1.5
@@ -56,55 +31,53 @@ Notes:
     - This command only triggers synchronization for existing mirrors
     - It does not create new mirrors
     - Failed sync attempts are logged to 04-trigger-failed.csv
-    - Rate limiting is controlled with --batch-size and --delay options
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+    - Concurrency is controlled with --batch-size and the start rate with --delay
+        """
 
-    # Group connection arguments
-    connection_group = parser.add_argument_group("GitLab Connection")
-    connection_group.add_argument(
-        "--source-url",
-        help="Source GitLab URL (default: from SOURCE_GITLAB_URL env var)",
-        default=get_env_variable("SOURCE_GITLAB_URL"),
-    )
-    connection_group.add_argument(
-        "--source-token",
-        help="Source GitLab token (default: from SOURCE_GITLAB_TOKEN env var)",
-        default=get_env_variable("SOURCE_GITLAB_TOKEN"),
-    )
 
-    # Group input arguments
-    input_group = parser.add_argument_group("Input")
-    input_group.add_argument(
-        "--projects-file",
-        help="File with project paths to trigger (CSV or plain text)",
-        required=True,
+@functools.lru_cache(maxsize=1)
+def _build_command(prog: Optional[str] = None) -> BaseCommand:
+    """Build the trigger parser once; repeated main() calls reuse it."""
+    cmd = BaseCommand(
+        prog=prog,
+        description="Trigger synchronization for existing GitLab push mirrors",
+        epilog=_EPILOG,
     )
 
+    cmd.add_projects_file_arg(required=True)
+
     # Group behavior arguments
-    behavior_group = parser.add_argument_group("Behavior")
-    behavior_group.add_argument(
+    cmd.behavior_group.add_argument(
         "--batch-size",
-        help="Number of projects to process in one batch (default: 5)",
+        help="Number of projects processed concurrently (default: 5)",
         type=int,
         default=5,
     )
-    behavior_group.add_argument(
-        "--delay", help="Delay between projects in seconds (default: 2.0)", type=float, default=2.0
+    cmd.behavior_group.add_argument(
+        "--delay",
+        help="Minimum delay between starting projects in seconds (default: 2.0)",
+        type=float,
+        default=2.0,
     )
 
-    # Debug options
-    debug_group = parser.add_argument_group("Debug Options")
-    debug_group.add_argument("--debug", help="Enable debug logging", action="store_true")
+    return cmd
+
+
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    """
+    Main entry point for the trigger command.
 
-    args = parser.parse_args()
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        prog: Program name for usage and error messages (default: from sys.argv[0])
+    """
+    cmd = _build_command(prog)
+    args = cmd.parse_args(argv)
 
-    # Enable debug logging if requested
-    if args.debug:
-        setup_logging(logging.DEBUG)
+    # Deferred so --help and usage errors don't import python-gitlab
+    from gitlab_mirror.utils.trigger import process_file  # pylint: disable=import-outside-toplevel
 
-    try:
+    def _run():
         # Process the file using the existing function from trigger.py
         process_file(
             file_path=args.projects_file,
@@ -112,16 +85,7 @@ Notes:
             delay_between_projects=args.delay,
         )
 
-    except ConfigError as e:
-        logger.error("Configuration error: %s", e)
-        sys.exit(1)
-    except MirrorError as e:
-        logger.error("Mirror operation failed: %s", e)
-        sys.exit(2)
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error("Unexpected error: %s", e)
-        traceback.print_exc()
-        sys.exit(3)
+    cmd.run_command(_run)
 
 
 if __name__ == "__main__":
@@ -7,43 +7,16 @@ It checks for missing projects, missing mirrors, and failed mirrors,
 and generates reports for troubleshooting.
 """
 
-import argparse
+import functools
 import logging
-import sys
-import traceback
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
 
-from dotenv import load_dotenv
-from pydantic import SecretStr
-
-from gitlab_mirror.core.config import GitLabConfig, MirrorConfig, get_env_variable
-from gitlab_mirror.core.exceptions import ConfigError, MirrorError
-from gitlab_mirror.core.mirror import MirrorService
-from gitlab_mirror.utils.verify import MirrorVerifier
+from gitlab_mirror.cli.base_command import CONNECTION_ARGS, BaseCommand
 
 logger = logging.getLogger(__name__)
 
-
-def setup_logging(level=logging.INFO):
-    """Configure logging for the application."""
-    logging.basicConfig(
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        level=level,
-    )
-
-
-def main():
-    """Main entry point for the verify command."""
-    # Setup logging
-    setup_logging()
-
-    # Load environment variables
-    load_dotenv()
-
-    # Parse command line arguments with enhanced help
-    parser = argparse.ArgumentParser(
-        description="Verify GitLab projects have been properly mirrored between instances",
-        epilog="""
+_EPILOG = """
 Examples:
     gitlab-mirror-verify
     gitlab-mirror-verify --projects-file=custom-projects.csv
@@ -57,72 +30,59 @@ Output files:
 
 The generated 00-fix.csv can be used with gitlab-mirror to fix the issues:
     gitlab-mirror --projects-file=00-fix.csv
-        """,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+        """
 
-    # Group connection arguments
-    connection_group = parser.add_argument_group("GitLab Connection")
-    connection_group.add_argument(
-        "--source-url",
-        help="Source GitLab URL (default: from SOURCE_GITLAB_URL env var)",
-        default=get_env_variable("SOURCE_GITLAB_URL"),
-    )
-    connection_group.add_argument(
-        "--source-token",
-        help="Source GitLab token (default: from SOURCE_GITLAB_TOKEN env var)",
-        default=get_env_variable("SOURCE_GITLAB_TOKEN"),
-    )
-    connection_group.add_argument(
-        "--target-url",
-        help="Target GitLab URL (default: from TARGET_GITLAB_URL env var)",
-        default=get_env_variable("TARGET_GITLAB_URL"),
-    )
-    connection_group.add_argument(
-        "--target-token",
-        help="Target GitLab token (default: from TARGET_GITLAB_TOKEN env var)",
-        default=get_env_variable("TARGET_GITLAB_TOKEN"),
-    )
 
-    # Group input arguments
-    input_group = parser.add_argument_group("Input")
-    input_group.add_argument(
-        "--projects-file",
-        help="CSV file with project mappings (default: from PROJECTS_FILE env var)",
-        default=get_env_variable("PROJECTS_FILE", "projects.csv"),
+@functools.lru_cache(maxsize=1)
+def _build_command(prog: Optional[str] = None) -> BaseCommand:
+    """Build the verify parser once; repeated main() calls reuse it."""
+    cmd = BaseCommand(
+        prog=prog,
+        description="Verify GitLab projects have been properly mirrored between instances",
+        epilog=_EPILOG,
     )
+    cmd.add_target_connection_args()
+    cmd.add_projects_file_arg()
+    cmd.require(*CONNECTION_ARGS)
 
-    # Debug options
-    debug_group = parser.add_argument_group("Debug Options")
-    debug_group.add_argument("--debug", help="Enable debug logging", action="store_true")
+    return cmd
 
-    args = parser.parse_args()
 
-    # Enable debug logging if requested
-    if args.debug:
-        setup_logging(logging.DEBUG)
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    """
+    Main entry point for the verify command.
 
-    # Check for required arguments
-    missing = []
-    if not args.source_url:
-        missing.append("source-url")
-    if not args.source_token:
-        missing.append("source-token")
-    if not args.target_url:
-        missing.append("target-url")
-    if not args.target_token:
-        missing.append("target-token")
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        prog: Program name for usage and error messages (default: from sys.argv[0])
+    """
+    cmd = _build_command(prog)
+    args = cmd.parse_args(argv)
 
-    if missing:
-        parser.error(f"Missing required arguments: {', '.join(missing)}")
+    # Deferred so --help and usage errors don't import the mirror service and python-gitlab
+    # pylint: disable=import-outside-toplevel
+    from gitlab_mirror.core.config import GitLabConfig, MirrorConfig
+    from gitlab_mirror.core.mirror import MirrorService
+    from gitlab_mirror.utils.verify import MirrorVerifier
 
-    try:
+    # pylint: enable=import-outside-toplevel
+
+    def _run():
         config = MirrorConfig(
-            source=GitLabConfig(url=args.source_url, token=SecretStr(args.source_token)),
-            target=GitLabConfig(url=args.target_url, token=SecretStr(args.target_token)),
-            projects_file=Path(args.projects_file),
+            source=GitLabConfig(url=args.source_url, token=args.source_token),
+            target=GitLabConfig(url=args.target_url, token=args.target_token),
+            projects_file=args.projects_file,
         )
 
+        # Authenticate against both instances concurrently; the clients are shared
+        # with the service and verifier, which then reuse the open connections
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [
+                executor.submit(gl_config.get_client().auth)
+                for gl_config in (config.source, config.target)
+            ]:
+                future.result()
+
         service = MirrorService(config)
 
         # Load project mappings
@@ -140,16 +100,7 @@ The generated 00-fix.csv can be used with gitlab-mirror to fix the issues:
         # Print report
         verifier.print_report()
 
-    except ConfigError as e:
-        logger.error("Configuration error: %s", e)
-        sys.exit(1)
-    except MirrorError as e:
-        logger.error("Mirror operation failed: %s", e)
-        sys.exit(2)
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        logger.error("Unexpected error: %s", e)
-        traceback.print_exc()
-        sys.exit(3)
+    cmd.run_command(_run)
 
 
 if __name__ == "__main__":
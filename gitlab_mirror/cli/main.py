@@ -2,87 +2,70 @@
 Command-line interface for GitLab mirroring tool.
 """
 
-import argparse
-import logging
-import os
-
-from dotenv import load_dotenv
-
-from gitlab_mirror.cli.commands.mirror_command import mirror_command
+import functools
+from typing import Optional, Sequence
+
+from gitlab_mirror.cli.base_command import CONNECTION_ARGS, BaseCommand
+from gitlab_mirror.core.config import env_bool
+
+_EPILOG = """
+Other commands (see gitlab-mirror <command> --help for their options):
+  verify        Verify projects have been properly mirrored between instances
+  update        Update or fix push mirrors with new authentication or URLs
+  trigger       Trigger synchronization for existing push mirrors
+  remove        Remove push mirrors from projects based on specified criteria
+  batch-remove  Remove push mirrors for projects specified in a CSV file
+"""
 
 
-def setup_logging(level=logging.INFO):
-    """Configure logging for the application."""
-    logging.basicConfig(
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        level=level,
+@functools.lru_cache(maxsize=1)
+def _build_command(prog: Optional[str] = None) -> BaseCommand:
+    """Build the mirror parser once; repeated main() calls reuse it."""
+    cmd = BaseCommand(
+        prog=prog,
+        description="GitLab Project Mirroring Tool",
+        epilog=_EPILOG,
     )
+    cmd.add_target_connection_args()
+    cmd.add_projects_file_arg()
 
-
-def main():
-    """Main entry point for the CLI tool."""
-    # Setup logging
-    setup_logging()
-
-    # Load environment variables
-    load_dotenv()
-
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="GitLab Project Mirroring Tool")
-
-    parser.add_argument(
-        "--source-url", help="Source GitLab URL", default=os.environ.get("SOURCE_GITLAB_URL", "")
-    )
-    parser.add_argument(
-        "--source-token",
-        help="Source GitLab token",
-        default=os.environ.get("SOURCE_GITLAB_TOKEN", ""),
-    )
-    parser.add_argument(
-        "--target-url", help="Target GitLab URL", default=os.environ.get("TARGET_GITLAB_URL", "")
-    )
-    parser.add_argument(
-        "--target-token",
-        help="Target GitLab token",
-        default=os.environ.get("TARGET_GITLAB_TOKEN", ""),
-    )
-    parser.add_argument(
-        "--projects-file",
-        help="CSV file with project mappings",
-        default=os.environ.get("PROJECTS_FILE", "projects.csv"),
-    )
-    parser.add_argument(
+    cmd.behavior_group.add_argument(
         "--assign-users",
-        help="Assign users from source to target groups",
+        help=(
+            "Assign users from source to target groups "
+            "(default: from ASSIGN_USERS_TO_GROUPS env var)"
+        ),
         action="store_true",
-        default=os.environ.get("ASSIGN_USERS_TO_GROUPS", "false").lower() in ("true", "1", "yes"),
+        default=None,
     )
-    parser.add_argument("--debug", help="Enable debug logging", action="store_true")
-    parser.add_argument(
+    cmd.behavior_group.add_argument(
         "--shallow",
         action="store_true",
         help="Perform shallow clone (no history) for faster migration",
     )
+    cmd.require(*CONNECTION_ARGS)
+
+    return cmd
+
 
-    args = parser.parse_args()
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    """
+    Main entry point for the CLI tool.
 
-    # Enable debug logging if requested
-    if args.debug:
-        setup_logging(logging.DEBUG)
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        prog: Program name for usage and error messages (default: from sys.argv[0])
+    """
+    cmd = _build_command(prog)
+    args = cmd.parse_args(argv)
+    if args.assign_users is None:
+        args.assign_users = env_bool("ASSIGN_USERS_TO_GROUPS")
 
-    # Check for required arguments
-    missing = []
-    if not args.source_url:
-        missing.append("source-url")
-    if not args.source_token:
-        missing.append("source-token")
-    if not args.target_url:
-        missing.append("target-url")
-    if not args.target_token:
-        missing.append("target-token")
+    # Deferred so --help and usage errors don't import the mirror service
+    # pylint: disable=import-outside-toplevel
+    from gitlab_mirror.cli.commands.mirror_command import mirror_command
 
-    if missing:
-        parser.error("Missing required arguments: %s" % ", ".join(missing))
+    # pylint: enable=import-outside-toplevel
 
     # Run the mirror command
     mirror_command(
@@ -1,24 +1,39 @@
 """Core functionality for the GitLab mirroring tool."""
 
-from gitlab_mirror.core.config import (
-    GitLabConfig,
-    MirrorConfig,
-    get_env_variable,
-    load_config_from_env,
-)
-from gitlab_mirror.core.exceptions import ApiError, ConfigError, MirrorError, UserMigrationError
-from gitlab_mirror.core.mirror import GitLabConnector, MirrorService, ProjectMapping
+import importlib
+from typing import Any
 
-__all__ = [
-    "MirrorError",
-    "ConfigError",
-    "ApiError",
-    "UserMigrationError",
-    "GitLabConfig",
-    "MirrorConfig",
-    "get_env_variable",
-    "load_config_from_env",
-    "GitLabConnector",
-    "MirrorService",
-    "ProjectMapping",
-]
+# Public name -> defining module; submodules are imported on first attribute access
+# so that e.g. importing core.config does not pull in the mirror service (python-gitlab).
+_LAZY_IMPORTS = {
+    "MirrorError": "gitlab_mirror.core.exceptions",
+    "ConfigError": "gitlab_mirror.core.exceptions",
+    "ApiError": "gitlab_mirror.core.exceptions",
+    "UserMigrationError": "gitlab_mirror.core.exceptions",
+    "GitLabConfig": "gitlab_mirror.core.config",
+    "MirrorConfig": "gitlab_mirror.core.config",
+    "SecretStr": "gitlab_mirror.core.config",
+    "configure_http_pool": "gitlab_mirror.core.config",
+    "env_bool": "gitlab_mirror.core.config",
+    "get_env_variable": "gitlab_mirror.core.config",
+    "load_config_from_env": "gitlab_mirror.core.config",
+    "load_env_once": "gitlab_mirror.core.config",
+    "parse_bool_env": "gitlab_mirror.core.config",
+    "GitLabConnector": "gitlab_mirror.core.mirror",
+    "MirrorService": "gitlab_mirror.core.mirror",
+    "ProjectMapping": "gitlab_mirror.core.mirror",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,69 +2,172 @@
 Configuration module for the GitLab mirroring project.
 
 This module provides configuration classes and validation for the project.
-It uses Pydantic for configuration validation and dotenv for loading
-environment variables.
+It uses plain frozen dataclasses for configuration validation and dotenv for
+loading environment variables.
 """
 
+import functools
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-import gitlab
-from dotenv import load_dotenv
-from pydantic import BaseModel, SecretStr, field_validator
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 from gitlab_mirror.core.exceptions import ConfigError
 
+if TYPE_CHECKING:
+    import gitlab
+    import requests
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
+# Values accepted as true for boolean environment variables
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
+# Keep-alive connections kept per host, above the number of parallel mirror workers
+HTTP_POOL_SIZE = 32
+
+
+@functools.lru_cache(maxsize=1)
+def load_env_once() -> bool:
+    """
+    Load environment variables from the .env file on first call only.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+    return load_dotenv()
+
+
+class SecretStr:
+    """String wrapper that keeps tokens out of reprs, logs and tracebacks."""
+
+    __slots__ = ("_secret_value",)
+
+    def __init__(self, secret_value: str):
+        self._secret_value = secret_value
+
+    def get_secret_value(self) -> str:
+        """Returns the wrapped secret."""
+        return self._secret_value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SecretStr) and other._secret_value == self._secret_value
+
+    def __hash__(self) -> int:
+        return hash(self._secret_value)
+
+    def __str__(self) -> str:
+        return "**********" if self._secret_value else ""
+
+    def __repr__(self) -> str:
+        return f"SecretStr('{self}')"
+
+
+def configure_http_pool(session: "requests.Session", pool_size: int = HTTP_POOL_SIZE) -> None:
+    """
+    Mount a larger connection pool with retries for gateway errors on a session.
+
+    The default requests pool keeps 10 connections per host, so parallel workers
+    would otherwise wait on each other for a socket or reconnect (a new TLS
+    handshake) for each request. 429 responses are left to python-gitlab, which
+    already honours Retry-After.
+
+    Args:
+        session: HTTP session to configure
+        pool_size: Maximum number of kept-alive connections per host
+    """
+    # pylint: disable=import-outside-toplevel
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
 
-class GitLabConfig(BaseModel):
+@functools.lru_cache(maxsize=8)
+def _get_client(url: str, private_token: str) -> "gitlab.Gitlab":
+    """Create one GitLab client (and HTTP session) per URL and token."""
+    import gitlab  # pylint: disable=import-outside-toplevel
+
+    client = gitlab.Gitlab(url=url, private_token=private_token)
+    configure_http_pool(client.session)
+    return client
+
+
+@dataclass(frozen=True)
+class GitLabConfig:
     """Configuration for GitLab connection with validation."""
 
     url: str
     token: SecretStr
 
-    @field_validator("url")
-    @classmethod
-    def validate_url(cls, v):
-        """Validates URL."""
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("URL must start with http:// or https://")
-        return v
+    def __post_init__(self):
+        """Validates URL and wraps a plain string token."""
+        if not isinstance(self.url, str) or not self.url.startswith(("http://", "https://")):
+            raise ConfigError(f"URL must start with http:// or https://: {self.url!r}")
+        if not isinstance(self.token, SecretStr):
+            object.__setattr__(self, "token", SecretStr(self.token))
 
-    def get_client(self) -> gitlab.Gitlab:
-        """Creates and returns a GitLab client."""
-        return gitlab.Gitlab(url=self.url, private_token=self.token.get_secret_value())
+    def get_client(self) -> "gitlab.Gitlab":
+        """Returns the GitLab client for this URL and token, creating it on first use."""
+        return _get_client(self.url, self.token.get_secret_value())
 
 
-class MirrorConfig(BaseModel):
+@dataclass(frozen=True)
+class MirrorConfig:
     """Overall configuration for the mirroring process."""
 
     source: GitLabConfig
     target: GitLabConfig
-    projects_file: Path
+    projects_file: Union[Path, str]
     assign_users: bool = False
     shallow: bool = False
 
-    @field_validator("projects_file")
-    @classmethod
-    def validate_projects_file(cls, v):
+    def __post_init__(self):
         """Validates integrity of projects file"""
-        if not v.exists():
-            raise ValueError(f"Projects file does not exist: {v}")
-        return v
+        projects_file = Path(self.projects_file)
+        # A single stat; the result is not cached since the file may be created or
+        # removed between config loads in the same process
+        try:
+            os.stat(projects_file)
+        except FileNotFoundError:
+            raise ConfigError(f"Projects file does not exist: {projects_file}") from None
+        except OSError as e:
+            raise ConfigError(f"Cannot access projects file {projects_file}: {e}") from e
+        object.__setattr__(self, "projects_file", projects_file)
+
+
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, str]:
+    """Snapshot the process environment once, after the .env file has been loaded."""
+    load_env_once()
+    return dict(os.environ)
+
+
+def _lookup_env(name: str) -> Optional[str]:
+    """Read an environment variable from the snapshot."""
+    return _env_snapshot().get(name)
 
 
 def get_env_variable(name: str, required: bool = False) -> Optional[str]:
     """
     Retrieve environment variable. Exit if required and missing.
 
+    Values come from a snapshot of the environment taken on the first lookup,
+    so later changes to os.environ are not seen (call _env_snapshot.cache_clear()
+    to take a new snapshot).
+
     Args:
         name: Name of the environment variable
         required: Whether the variable is required
@@ -75,7 +178,7 @@ def get_env_variable(name: str, required: bool = False) -> Optional[str]:
     Raises:
         ConfigError: If the variable is required but not found
     """
-    value = os.getenv(name)
+    value = _lookup_env(name)
 
     if required and not value:
         logger.error("Missing required environment variable: %s", name)
@@ -84,6 +187,37 @@ def get_env_variable(name: str, required: bool = False) -> Optional[str]:
     return value
 
 
+def parse_bool_env(value: Optional[str]) -> bool:
+    """
+    Interpret an environment variable value as a boolean.
+
+    Args:
+        value: Raw value, may be None
+
+    Returns:
+        True for 1/true/yes/y/on (case-insensitive, surrounding whitespace ignored)
+    """
+    return bool(value) and value.strip().lower() in _TRUTHY
+
+
+@functools.lru_cache(maxsize=16)
+def env_bool(name: str, default: bool = False) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    Args:
+        name: Name of the environment variable
+        default: Value returned when the variable is unset or empty
+
+    Returns:
+        True if the value is truthy according to parse_bool_env()
+    """
+    value = _lookup_env(name)
+    if not value:
+        return default
+    return parse_bool_env(value)
+
+
 def load_config_from_env() -> MirrorConfig:
     """
     Load configuration from environment variables.
@@ -100,12 +234,7 @@ def load_config_from_env() -> MirrorConfig:
         target_url = get_env_variable("TARGET_GITLAB_URL", required=True)
         target_token = get_env_variable("TARGET_GITLAB_TOKEN", required=True)
         projects_file_str = get_env_variable("PROJECTS_FILE", required=True)
-        assign_users_str = get_env_variable("ASSIGN_USERS_TO_GROUPS", required=False)
-
-        # Convert assign_users_str to bool
-        assign_users = False
-        if assign_users_str:
-            assign_users = assign_users_str.lower() in ("true", "yes", "1")
+        assign_users = parse_bool_env(get_env_variable("ASSIGN_USERS_TO_GROUPS"))
 
         # Validate projects_file
         if not projects_file_str:
@@ -121,6 +250,8 @@ def load_config_from_env() -> MirrorConfig:
         )
 
         return config
+    except ConfigError:
+        raise
     except ValueError as e:
         logger.error("Configuration validation error: %s", e)
         raise ConfigError(f"Configuration validation error: {e}") from e
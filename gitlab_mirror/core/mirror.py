@@ -4,62 +4,166 @@ Provides abstraction for GitLab connections and mirroring operations.
 """
 
 import csv
+import functools
+import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, is_dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
-import pandas as pd
 from gitlab.exceptions import GitlabCreateError, GitlabGetError, GitlabHttpError, GitlabListError
 
 from gitlab_mirror.core.config import GitLabConfig, MirrorConfig, get_env_variable
 from gitlab_mirror.core.exceptions import ApiError, ConfigError
 from gitlab_mirror.utils.large_repo_handler import is_large_repository, mirror_large_repository
 
+# Optional: faster JSON for the error log and group cache
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on projects mirrored concurrently, to stay within GitLab API rate limits
+MAX_PARALLEL_PROJECTS = 10
+
+# Threads sending mirror sync triggers in the background
+MAX_SYNC_WORKERS = 4
+
+# Target group path -> id caches persist here between runs, one file per target host
+GROUP_CACHE_DIR = Path.home() / ".cache" / "gitlab_mirror"
+
+# Mirroring failures are appended here as JSON lines while the run progresses
+ERROR_LOG_FILE = "mirror_errors.jsonl"
+
+# Mapping files at least this large are parsed with pyarrow when it is installed
+PYARROW_MIN_FILE_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_mirror_url(url: str) -> str:
+    """Normalize mirror URL by removing credentials for comparison."""
+    _, sep, host_and_path = url.partition("@")
+    return host_and_path if sep else url
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to JSON, with orjson when installed (which handles dataclasses natively)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    if is_dataclass(obj):
+        obj = asdict(obj)
+    return json.dumps(obj)
+
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_rows_with_pyarrow(path: Path) -> Optional[List[List[str]]]:
+    """
+    Read the first two columns of a CSV file with pyarrow's multi-threaded reader.
+
+    Returns:
+        Rows as [source_path, target_group] lists, or None if pyarrow is not
+        installed or cannot parse the file (e.g. rows with differing column counts)
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    columns = ["f0", "f1"]
+    try:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in columns},
+                include_columns=columns,
+                include_missing_columns=True,
+            ),
+        )
+    except pa.ArrowException as e:
+        logger.debug("pyarrow could not parse %s, falling back to csv: %s", path, e)
+        return None
+
+    return [
+        [source_path or "", target_group or ""]
+        for source_path, target_group in zip(
+            table.column(0).to_pylist(), table.column(1).to_pylist()
+        )
+    ]
+
 
 # Core data models
-@dataclass
+@dataclass(frozen=True)
 class ProjectMapping:
-    """Represents a mapping between source and target projects."""
+    """
+    Represents a mapping between source and target projects.
+
+    The derived paths are computed once on creation, since mirror_project reads
+    them several times per project.
+    """
 
     source_path: str
     target_group: str
-
-    @property
-    def project_name(self) -> str:
-        """Extract project name from source path."""
-        return self.source_path.split("/")[-1]
-
-    @property
-    def source_group(self) -> str:
-        """Extract source group path."""
-        if "/" in self.source_path:
-            return self.source_path.rsplit("/", 1)[0]
-        return ""
-
-    @property
-    def should_preserve_structure(self) -> bool:
-        """
-        Determine if we should preserve the original group structure.
-        This is true when target_group is empty.
-        """
-        return not self.target_group
-
-    @property
-    def target_path(self) -> str:
-        """
-        Construct the full target path.
-        - If target_group is empty, use source structure as-is
-        - Otherwise use the specified target group
-        """
-        if self.should_preserve_structure:
-            # No target group specified, use source structure as-is
-            return self.source_path
-        else:
-            # Use specified target group
-            return "%s/%s" % (self.target_group, self.project_name)
+    # Project name taken from the source path
+    project_name: str = field(init=False)
+    # Source group path ("" for a top-level project)
+    source_group: str = field(init=False)
+    # True when target_group is empty, i.e. the source group structure is kept
+    should_preserve_structure: bool = field(init=False)
+    # Target group the project is created in ("" for a top-level project)
+    target_group_path: str = field(init=False)
+    # Full target path: the source path as-is, or target_group/project_name
+    target_path: str = field(init=False)
+
+    def __post_init__(self):
+        source_group, _, project_name = self.source_path.rpartition("/")
+        preserve = not self.target_group
+        object.__setattr__(self, "project_name", project_name)
+        object.__setattr__(self, "source_group", source_group)
+        object.__setattr__(self, "should_preserve_structure", preserve)
+        object.__setattr__(
+            self, "target_group_path", source_group if preserve else self.target_group
+        )
+        object.__setattr__(
+            self,
+            "target_path",
+            self.source_path if preserve else f"{self.target_group}/{project_name}",
+        )
+
+
+def _is_namespace_error(error: ApiError) -> bool:
+    """Whether a project creation failed because its namespace does not exist."""
+    cause = error.__cause__
+    return (
+        isinstance(cause, GitlabCreateError)
+        and cause.response_code in (400, 404)
+        and "namespace" in str(cause.error_message).lower()
+    )
+
+
+@dataclass(frozen=True)
+class MirrorErrorRecord:
+    """A project that failed to mirror."""
+
+    source: str
+    target: str
+    error_type: str
+    message: str
 
 
 class GitLabConnector:
@@ -95,8 +199,17 @@ class GitLabConnector:
             logger.error("Failed to create group %s: %s", path, e)
             raise ApiError(f"Failed to create group {path}") from e
 
-    def create_project(self, name: str, namespace_id: int) -> Any:
-        """Create a new project."""
+    def create_project(
+        self, name: str, namespace_id: int, namespace_path: Optional[str] = None
+    ) -> Any:
+        """
+        Create a new project.
+
+        If namespace_path is given and the path is already taken, the existing
+        project is returned instead, so callers need no separate existence check.
+        The same lookup is tried when creating is forbidden, since a token may be
+        able to read an existing project but not create projects in its group.
+        """
         try:
             return self.client.projects.create(
                 {
@@ -108,14 +221,28 @@ class GitLabConnector:
                 }
             )
         except GitlabCreateError as e:
+            if (
+                namespace_path
+                and e.response_code == 400
+                and "taken" in str(e.error_message).lower()
+            ):
+                logger.info("Target project already exists: %s/%s", namespace_path, name)
+                return self.get_project(f"{namespace_path}/{name}")
+            if namespace_path and e.response_code == 403:
+                try:
+                    project = self.client.projects.get(f"{namespace_path}/{name}")
+                    logger.info("Target project already exists: %s/%s", namespace_path, name)
+                    return project
+                except GitlabGetError:
+                    # Not there either, so the project really can't be created
+                    pass
             logger.error("Failed to create project %s: %s", name, e)
             raise ApiError(f"Failed to create project {name}") from e
 
-    def normalize_mirror_url(self, url: str) -> str:
+    @staticmethod
+    def normalize_mirror_url(url: str) -> str:
         """Normalize mirror URL by removing credentials for comparison."""
-        if "@" in url:
-            return url.split("@", 1)[-1]
-        return url
+        return normalize_mirror_url(url)
 
 
 class MirrorService:
@@ -128,7 +255,85 @@ class MirrorService:
         self.target = GitLabConnector(config.target)
         self.shallow = config.shallow  # Store shallow option
         self.group_cache: Dict[str, int] = {}
-        self.errors: List[Dict[str, str]] = []
+        self.errors: List[MirrorErrorRecord] = []
+        self._error_log: Optional[IO[str]] = None
+        # Runs sync triggers in the background while mirror_all_projects is active
+        self._sync_executor: Optional[ThreadPoolExecutor] = None
+        # Guards group_cache and errors while projects are mirrored in parallel
+        self._lock = threading.Lock()
+        # Invariant for the whole run, so split the URLs and unwrap the tokens once
+        self._source_domain = config.source.url.split("//", 1)[1].split("/", 1)[0]
+        self._target_domain = config.target.url.split("//", 1)[1].split("/", 1)[0]
+        self._source_token = config.source.token.get_secret_value()
+        self._target_token = config.target.token.get_secret_value()
+        self._mirror_url_prefix = f"https://oauth2:{self._target_token}@{self._target_domain}/"
+        self.group_cache_file = (
+            GROUP_CACHE_DIR / f"groups-{urlparse(config.target.url).netloc}.json"
+        )
+        self._load_group_cache()
+
+    def _load_group_cache(self) -> None:
+        """Seed the group cache from the previous run's cache file, if any."""
+        try:
+            with open(self.group_cache_file, "r", encoding="utf-8") as f:
+                cached = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable group cache %s: %s", self.group_cache_file, e)
+            return
+        if isinstance(cached, dict):
+            self.group_cache.update(
+                (path, group_id) for path, group_id in cached.items() if isinstance(group_id, int)
+            )
+
+    def _save_group_cache(self) -> None:
+        """Write the group cache to disk for the next run."""
+        try:
+            self.group_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.group_cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(_json_dumps(self.group_cache))
+            tmp_file.replace(self.group_cache_file)
+        except OSError as e:
+            logger.warning("Could not save group cache %s: %s", self.group_cache_file, e)
+
+    def prefetch_groups(self) -> None:
+        """
+        Seed the group cache with every group visible on the target.
+
+        One paginated list call replaces a GET per group (and per path level) in
+        ensure_group_exists. The listing is complete, so it replaces the cache and
+        drops groups deleted since the cache file was written. Failures are logged
+        and leave the cache as it was.
+        """
+        try:
+            groups = {
+                group.full_path: group.id
+                for group in self.target.client.groups.list(iterator=True, per_page=100)
+            }
+        except (GitlabListError, GitlabHttpError) as e:
+            logger.warning("Could not prefetch target groups: %s", e)
+            return
+        with self._lock:
+            self.group_cache.clear()
+            self.group_cache.update(groups)
+        logger.debug("Prefetched %d target groups", len(groups))
+
+    def forget_group(self, group_path: str) -> None:
+        """
+        Drop a group, its parents and its subgroups from the group cache.
+
+        Used when a cached id turns out to be stale, e.g. because the group was
+        deleted or recreated since it was cached, so ensure_group_exists looks
+        the whole path up again.
+        """
+        parts = group_path.split("/")
+        stale_paths = {"/".join(parts[:i]) for i in range(1, len(parts) + 1)}
+        with self._lock:
+            for path in list(self.group_cache):
+                if path in stale_paths or path.startswith(f"{group_path}/"):
+                    del self.group_cache[path]
 
     def load_project_mappings(self) -> List[ProjectMapping]:
         """
@@ -141,88 +346,83 @@ class MirrorService:
         Returns:
             List of ProjectMapping objects.
         """
-        mappings = []
-
         try:
-            # First try reading with pandas
-            try:
-                df = pd.read_csv(self.config.projects_file, header=None)
-
-                for _, row in df.iterrows():
-                    # Get source path from first column
-                    source_path = row[0].strip()
-
-                    # Default empty target group
-                    target_group = ""
-
-                    # Check for target group in second column
-                    if len(row) >= 2 and pd.notna(row[1]):
-                        target_group = row[1].strip()
-
-                    mappings.append(
-                        ProjectMapping(source_path=source_path, target_group=target_group)
-                    )
-
-            # Fallback to manual CSV parsing if pandas fails
-            except OSError as pandas_error:
-                logger.warning("Pandas parsing failed, fallback to manual CSV: %s", pandas_error)
-                with open(self.config.projects_file, "r", encoding="utf-8") as file:
-                    reader = csv.reader(file)
-                    for row in reader:
-                        if row:  # Skip empty rows
-                            source_path = row[0].strip()
-                            target_group = row[1].strip() if len(row) > 1 else ""
-
-                            mappings.append(
-                                ProjectMapping(source_path=source_path, target_group=target_group)
-                            )
+            # Skip empty rows and comment lines
+            mappings = [
+                ProjectMapping(row[0].strip(), row[1].strip() if len(row) > 1 else "")
+                for row in self._iter_mapping_rows()
+                if row and not row[0].lstrip().startswith("#")
+            ]
 
             if not mappings:
                 logger.warning("No project mappings found in the CSV file")
 
             return mappings
 
-        except Exception as e:
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
             logger.error("Failed to load project mappings: %s", e)
             raise ConfigError(
                 f"Failed to load project mappings from {self.config.projects_file}"
             ) from e
 
+    def _iter_mapping_rows(self) -> Iterator[List[str]]:
+        """Yield the raw rows of the projects file, using pyarrow for large files."""
+        projects_file = self.config.projects_file
+        if os.path.getsize(projects_file) >= PYARROW_MIN_FILE_SIZE:
+            rows = _read_rows_with_pyarrow(projects_file)
+            if rows is not None:
+                yield from rows
+                return
+
+        with open(projects_file, "r", newline="", encoding="utf-8") as file:
+            yield from csv.reader(file)
+
     def ensure_group_exists(self, group_path: str) -> Any:
         """Ensure a group exists, creating it if necessary."""
         if not group_path:
             raise ValueError("Group path cannot be empty")
 
-        # Check cache first
-        if group_path in self.group_cache:
-            return self.group_cache[group_path]
-
-        # Try to find existing group
-        existing_group = self.target.get_group(group_path)
-        if existing_group:
-            self.group_cache[group_path] = existing_group.id
-            return existing_group.id
-
-        # Create parent groups recursively if needed
-        parent_id = None
-        if "/" in group_path:
-            parent_path = group_path.rsplit("/", 1)[0]
-            parent_id = self.ensure_group_exists(parent_path)
+        parts = group_path.split("/")
+
+        # Held across lookup and creation so two workers don't create the same group
+        with self._lock:
+            # Find the deepest existing group, trying the full path first so an
+            # existing hierarchy costs a single request
+            base_idx = 0
+            parent_id = None
+            for i in range(len(parts), 0, -1):
+                path = "/".join(parts[:i])
+                if path in self.group_cache:
+                    parent_id = self.group_cache[path]
+                    base_idx = i
+                    break
+                existing_group = self.target.get_group(path)
+                if existing_group:
+                    parent_id = self.group_cache[path] = existing_group.id
+                    base_idx = i
+                    break
+
+            # Create the missing groups top-down below it
+            for j in range(base_idx, len(parts)):
+                group_name = parts[j]
+                new_group = self.target.create_group(
+                    name=group_name, path=group_name, parent_id=parent_id
+                )
+                parent_id = self.group_cache["/".join(parts[: j + 1])] = new_group.id
 
-        # Create the group
-        group_name = group_path.rsplit("/", 1)[-1]
-        new_group = self.target.create_group(name=group_name, path=group_name, parent_id=parent_id)
-        self.group_cache[group_path] = new_group.id
-        return new_group.id
+            return parent_id
 
     def setup_push_mirror(self, source_project, mirror_url: str) -> None:
         """Set up push mirroring for a project."""
         try:
-            mirrors = source_project.remote_mirrors.list()
-
-            # Check if mirror already exists
-            normalized_url = self.source.normalize_mirror_url(mirror_url)
-            if any(self.source.normalize_mirror_url(m.url) == normalized_url for m in mirrors):
+            # Check if mirror already exists; any() stops at the first match, so
+            # later pages of the listing are never requested
+            normalized_url = normalize_mirror_url(mirror_url)
+            mirror_exists = any(
+                normalize_mirror_url(m.url) == normalized_url
+                for m in source_project.remote_mirrors.list(iterator=True, per_page=100)
+            )
+            if mirror_exists:
                 logger.info("Mirror already exists for %s", source_project.path_with_namespace)
                 return
 
@@ -252,7 +452,7 @@ class MirrorService:
         """Trigger synchronization for a project's mirrors."""
         try:
             project = self.source.client.projects.get(project_id)
-            mirrors = project.remote_mirrors.list()
+            mirrors = project.remote_mirrors.list(iterator=True, per_page=100)
 
             for mirror in mirrors:
                 try:
@@ -279,14 +479,8 @@ class MirrorService:
             source_project = self.source.get_project(mapping.source_path)
             logger.info("Found source project: %s", mapping.source_path)
 
-            # Determine the appropriate target group path
-            target_group_path = ""
-            if mapping.should_preserve_structure:
-                # Use source group structure as-is
-                target_group_path = mapping.source_group
-            else:
-                # Use specified target group
-                target_group_path = mapping.target_group
+            # Source group structure as-is, or the specified target group
+            target_group_path = mapping.target_group_path
 
             # Log for debugging
             logger.debug("Target group path: %s", target_group_path)
@@ -305,21 +499,37 @@ class MirrorService:
             # Log correct path
             logger.info("Target path will be: %s", target_path)
 
-            # Check if target project exists
-            try:
-                self.target.get_project(target_path)
-                logger.info("Target project already exists: %s", target_path)
-            except ApiError:
-                if not group_id:
+            if group_id:
+                # Create the target project directly; an existing one is returned as-is
+                try:
+                    self.target.create_project(
+                        name=project_name, namespace_id=group_id, namespace_path=target_group_path
+                    )
+                except ApiError as e:
+                    if not _is_namespace_error(e):
+                        raise
+                    # The cached group id is stale, so look the group up again and retry
+                    logger.warning(
+                        "Cached target group %s no longer exists, looking it up again",
+                        target_group_path,
+                    )
+                    self.forget_group(target_group_path)
+                    group_id = self.ensure_group_exists(target_group_path)
+                    self.target.create_project(
+                        name=project_name, namespace_id=group_id, namespace_path=target_group_path
+                    )
+                logger.info("Target project ready: %s", target_path)
+            else:
+                # Without a group the project can't be created, only found
+                try:
+                    self.target.get_project(target_path)
+                    logger.info("Target project already exists: %s", target_path)
+                except ApiError:
                     logger.error(
                         "Cannot create project without a group. Target group path is empty."
                     )
                     return False
 
-                # Create target project
-                self.target.create_project(name=project_name, namespace_id=group_id)
-                logger.info("Created target project: %s", target_path)
-
             threshold_mb = int(
                 get_env_variable("LARGE_REPO_SIZE_THRESHOLD", required=False) or "1800"
             )
@@ -335,18 +545,15 @@ class MirrorService:
                     threshold_mb,
                 )
 
-                # Extract domain parts from URLs
-                source_domain = self.source.config.url.split("//")[1].split("/")[0]
-                target_domain = self.target.config.url.split("//")[1].split("/")[0]
-
-                # Setup mirroring using the large repo handler
+                # Setup mirroring using the large repo handler; it limits how many
+                # workers clone at once and serializes mappings of the same source
                 success = mirror_large_repository(
-                    source_url=source_domain,
+                    source_url=self._source_domain,
                     source_project_path=mapping.source_path,
-                    source_token=self.source.config.token.get_secret_value(),
-                    target_url=target_domain,
+                    source_token=self._source_token,
+                    target_url=self._target_domain,
                     target_project_path=target_path,
-                    target_token=self.target.config.token.get_secret_value(),
+                    target_token=self._target_token,
                     chunk_size=int(
                         get_env_variable("LARGE_REPO_CHUNK_SIZE", required=False) or "25"
                     ),
@@ -365,57 +572,28 @@ class MirrorService:
                 return True
             else:
                 # Set up mirroring for normal-sized repositories
-                target_domain = self.target.config.url.split("//")[1].split("/")[0]
-                mirror_url = f"https://oauth2:{self.target.config.token.get_secret_value()}@{target_domain}/{target_path}.git"  # noqa: E501, E231
+                mirror_url = f"{self._mirror_url_prefix}{target_path}.git"
 
                 self.setup_push_mirror(source_project, mirror_url)
 
-                # Trigger initial sync
-                self.trigger_mirror_sync(source_project.id)
+                # Trigger initial sync; GitLab only schedules it, so don't wait on it
+                if self._sync_executor is not None:
+                    self._sync_executor.submit(self.trigger_mirror_sync, source_project.id)
+                else:
+                    self.trigger_mirror_sync(source_project.id)
                 return True
-        except ApiError as e:
-            logger.error("API error mirroring project %s: %s", mapping.source_path, e)
-            self.errors.append(
-                {
-                    "source": mapping.source_path,
-                    "target": (
-                        mapping.target_path
-                        if "mapping.target_path" in locals()
-                        else mapping.target_path
-                    ),
-                    "error_type": "ApiError",
-                    "message": str(e),
-                }
-            )
-            return False
-        except ValueError as e:
-            logger.error("Value error mirroring project %s: %s", mapping.source_path, e)
-            self.errors.append(
-                {
-                    "source": mapping.source_path,
-                    "target": (
-                        mapping.target_path
-                        if "mapping.target_path" in locals()
-                        else mapping.target_path
-                    ),
-                    "error_type": "ValueError",
-                    "message": str(e),
-                }
-            )
-            return False
         except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Unexpected error mirroring project %s: %s", mapping.source_path, e)
-            self.errors.append(
-                {
-                    "source": mapping.source_path,
-                    "target": (
-                        mapping.target_path
-                        if "mapping.target_path" in locals()
-                        else mapping.target_path
-                    ),
-                    "error_type": "UnexpectedError",
-                    "message": str(e),
-                }
+            # ApiError and ValueError are the expected failures; anything else is
+            # recorded the same way under its own type name
+            error_type = type(e).__name__
+            logger.error("%s mirroring project %s: %s", error_type, mapping.source_path, e)
+            self._record_error(
+                MirrorErrorRecord(
+                    source=mapping.source_path,
+                    target=mapping.target_path,
+                    error_type=error_type,
+                    message=str(e),
+                )
             )
             return False
 
@@ -426,22 +604,74 @@ class MirrorService:
         success_count = 0
         failure_count = 0
 
-        for mapping in mappings:
-            logger.info(
-                "Processing: %s -> %s",
-                mapping.source_path,
-                mapping.target_group if mapping.target_group else "(preserve structure)",
-            )
-
-            if self.mirror_project(mapping):
-                success_count += 1
-            else:
-                failure_count += 1
+        self._sync_executor = ThreadPoolExecutor(max_workers=MAX_SYNC_WORKERS)
+        try:
+            self.prefetch_groups()
+            self.create_target_groups(mappings)
+
+            # Each project is several blocking API round-trips, so overlap them in threads
+            max_workers = max(1, min(MAX_PARALLEL_PROJECTS, len(mappings)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._process_mapping, mapping) for mapping in mappings]
+                for future in as_completed(futures):
+                    if future.result():
+                        success_count += 1
+                    else:
+                        failure_count += 1
+        finally:
+            # Let queued sync triggers finish before the process can exit
+            self._sync_executor.shutdown(wait=True)
+            self._sync_executor = None
+            self._save_group_cache()
+            self._close_error_log()
 
         logger.info("Mirroring complete. Success: %d, Failures: %d", success_count, failure_count)
         self._print_errors_summary()
         return success_count, failure_count
 
+    def create_target_groups(self, mappings: List[ProjectMapping]) -> None:
+        """
+        Create every target group needed by the mappings before mirroring starts.
+
+        Each distinct group is resolved once, parents before children, so the
+        parallel workers find their groups in the cache. A group that cannot be
+        created is logged here and reported again by the projects that need it.
+        """
+        required_paths = {m.target_group_path for m in mappings if m.target_group_path}
+        for group_path in sorted(required_paths, key=lambda p: (p.count("/"), p)):
+            try:
+                self.ensure_group_exists(group_path)
+            except ApiError as e:
+                logger.error("Failed to prepare target group %s: %s", group_path, e)
+
+    def _process_mapping(self, mapping: ProjectMapping) -> bool:
+        """Log and mirror a single mapping; runs in a worker thread."""
+        logger.info(
+            "Processing: %s -> %s",
+            mapping.source_path,
+            mapping.target_group if mapping.target_group else "(preserve structure)",
+        )
+        return self.mirror_project(mapping)
+
+    def _record_error(self, error: MirrorErrorRecord) -> None:
+        """Keep a failure for the summary and append it to the error log file."""
+        with self._lock:
+            self.errors.append(error)
+            try:
+                if self._error_log is None:
+                    self._error_log = open(ERROR_LOG_FILE, "a", encoding="utf-8")
+                self._error_log.write(_json_dumps(error) + "\n")
+                self._error_log.flush()
+            except OSError as e:
+                logger.warning("Could not write to %s: %s", ERROR_LOG_FILE, e)
+
+    def _close_error_log(self) -> None:
+        """Close the error log file if any error was written."""
+        with self._lock:
+            if self._error_log is not None:
+                self._error_log.close()
+                self._error_log = None
+
     def _print_errors_summary(self) -> None:
         """Prints all collected errors in a formatted way."""
         if not self.errors:
@@ -451,10 +681,10 @@ class MirrorService:
         print("=" * 50)
         for idx, error in enumerate(self.errors, 1):
             print(f"Error #{idx}: ")
-            print(f"  Source Project: {error['source']}")
-            print(f"  Target Path:    {error['target']}")
-            print(f"  Error Type:     {error['error_type']}")
-            print(f"  Message:        {error['message']}")
+            print(f"  Source Project: {error.source}")
+            print(f"  Target Path:    {error.target}")
+            print(f"  Error Type:     {error.error_type}")
+            print(f"  Message:        {error.message}")
             print("-" * 50)
         print(f"Total Errors: {len(self.errors)}")
         print("=" * 50 + "\n")
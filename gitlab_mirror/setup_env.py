@@ -68,8 +68,6 @@ def check_dependencies():
     """Check if required Python packages are installed."""
     try:
         import gitlab  # noqa: F401
-        import pandas  # noqa: F401
-        import pydantic  # noqa: F401
         from dotenv import load_dotenv  # noqa: F401
     except ImportError as e:
         print(f"Missing dependency: {e}")
@@ -24,6 +24,16 @@ def test_utils_imports():
     assert True, "Utils imports successful"  # nosec B101
 
 
+def test_package_exports_resolve():
+    """Test that every name exported by the lazily loading packages resolves."""
+    import gitlab_mirror.core
+    import gitlab_mirror.utils
+
+    for package in (gitlab_mirror.core, gitlab_mirror.utils):
+        for name in package.__all__:
+            assert getattr(package, name) is not None, name  # nosec B101
+
+
 def test_cli_imports():
     """Test that CLI modules can be imported."""
     from gitlab_mirror.cli import main  # noqa: F401
@@ -32,9 +42,29 @@ def test_cli_imports():
     assert True, "CLI imports successful"  # nosec B101
 
 
+def test_command_imports_do_not_parse_argv():
+    """Test that importing command modules does not parse the command line."""
+    import importlib
+    import sys
+
+    from gitlab_mirror.cli.__main__ import COMMANDS
+
+    saved_argv = sys.argv
+    # An unknown option makes argparse exit if any module parses at import time
+    sys.argv = ["gitlab-mirror", "--no-such-option"]
+    try:
+        for module_name in COMMANDS.values():
+            module = importlib.import_module(module_name)
+            assert callable(module.main), module_name  # nosec B101
+    finally:
+        sys.argv = saved_argv
+
+
 if __name__ == "__main__":
     # Run tests directly when file is executed
     test_core_imports()
     test_utils_imports()
+    test_package_exports_resolve()
     test_cli_imports()
+    test_command_imports_do_not_parse_argv()
     print("All import tests passed!")
@@ -0,0 +1,75 @@
+"""
+Tests that both projects file readers produce the same project mappings.
+"""
+
+import csv
+from types import SimpleNamespace
+
+import pytest
+
+from gitlab_mirror.core import mirror
+from gitlab_mirror.core.mirror import MirrorService
+
+PROJECTS_CSV = (
+    "source_path,target_group\n"
+    "# legacy projects, moved later\n"
+    "\n"
+    "group/a,target/one\n"
+    '"group/with,comma","target/""quoted"""\n'
+    "  group/spaced  , target/two \n"
+    "group/c,\n"
+)
+
+
+def _load_mappings(projects_file, pyarrow_min_file_size, monkeypatch):
+    """Load mappings from projects_file with the given pyarrow size threshold."""
+    monkeypatch.setattr(mirror, "PYARROW_MIN_FILE_SIZE", pyarrow_min_file_size)
+    service = MirrorService.__new__(MirrorService)
+    service.config = SimpleNamespace(projects_file=str(projects_file))
+    return service.load_project_mappings()
+
+
+def test_pyarrow_rows_match_csv_module(tmp_path):
+    """Test that pyarrow reads the same rows as csv, apart from blank lines."""
+    pytest.importorskip("pyarrow")
+    projects_file = tmp_path / "projects.csv"
+    projects_file.write_text(PROJECTS_CSV, encoding="utf-8")
+
+    with open(projects_file, "r", newline="", encoding="utf-8") as f:
+        expected = [(row + [""])[:2] for row in csv.reader(f) if row]
+
+    assert mirror._read_rows_with_pyarrow(projects_file) == expected  # nosec B101
+
+
+def test_pyarrow_and_csv_mappings_match(tmp_path, monkeypatch):
+    """Test that load_project_mappings gives the same result with either reader."""
+    pytest.importorskip("pyarrow")
+    projects_file = tmp_path / "projects.csv"
+    projects_file.write_text(PROJECTS_CSV, encoding="utf-8")
+
+    with_csv = _load_mappings(projects_file, float("inf"), monkeypatch)
+    with_pyarrow = _load_mappings(projects_file, 0, monkeypatch)
+
+    assert with_pyarrow == with_csv  # nosec B101
+    assert [m.source_path for m in with_csv] == [  # nosec B101
+        "source_path",
+        "group/a",
+        "group/with,comma",
+        "group/spaced",
+        "group/c",
+    ]
+    assert with_csv[2].target_group == 'target/"quoted"'  # nosec B101
+
+
+def test_pyarrow_falls_back_on_uneven_rows(tmp_path, monkeypatch):
+    """Test that a file pyarrow cannot parse is read with the csv module instead."""
+    pytest.importorskip("pyarrow")
+    projects_file = tmp_path / "projects.csv"
+    projects_file.write_text("# one column comment\ngroup/a,target/one\ngroup/b\n")
+
+    assert mirror._read_rows_with_pyarrow(projects_file) is None  # nosec B101
+    mappings = _load_mappings(projects_file, 0, monkeypatch)
+    assert [(m.source_path, m.target_group) for m in mappings] == [  # nosec B101
+        ("group/a", "target/one"),
+        ("group/b", ""),
+    ]
@@ -0,0 +1,109 @@
+"""
+Tests for the concurrency helpers shared by the bulk mirror commands.
+"""
+
+import gc
+import threading
+import time
+
+import pytest
+
+from gitlab_mirror.utils import parallel
+from gitlab_mirror.utils.parallel import RateLimiter, bounded_map, bulk_gc
+
+
+def test_bounded_map_limits_items_in_flight():
+    """Test that at most 2 * max_workers items are taken from a lazy iterable at once."""
+    max_workers = 2
+    lock = threading.Lock()
+    consumed = 0
+    finished = 0
+    max_in_flight = 0
+
+    def items():
+        nonlocal consumed, max_in_flight
+        for i in range(20):
+            with lock:
+                consumed += 1
+                max_in_flight = max(max_in_flight, consumed - finished)
+            yield i
+
+    def work(item):
+        nonlocal finished
+        time.sleep(0.01)
+        with lock:
+            finished += 1
+        return item * 2
+
+    results = {item: future.result() for item, future in bounded_map(work, items(), max_workers)}
+
+    assert results == {i: i * 2 for i in range(20)}  # nosec B101
+    assert max_in_flight <= 2 * max_workers  # nosec B101
+
+
+def test_bounded_map_reraises_from_result():
+    """Test that an exception raised by func comes back through future.result()."""
+
+    def work(item):
+        if item == 3:
+            raise ValueError("bad item")
+        return item
+
+    outcomes = {}
+    for item, future in bounded_map(work, range(5), max_workers=2):
+        try:
+            outcomes[item] = future.result()
+        except ValueError as e:
+            outcomes[item] = str(e)
+
+    assert outcomes == {0: 0, 1: 1, 2: 2, 3: "bad item", 4: 4}  # nosec B101
+
+
+def test_rate_limiter_spaces_start_times():
+    """Test that calls from several threads start at least one interval apart."""
+    interval = 0.05
+    limiter = RateLimiter(interval)
+    starts = []
+    lock = threading.Lock()
+
+    def call():
+        limiter.acquire()
+        with lock:
+            starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    # Allow for timer resolution around each sleep
+    assert all(gap >= interval * 0.8 for gap in gaps), gaps  # nosec B101
+
+
+def test_rate_limiter_without_interval_does_not_wait():
+    """Test that a zero interval never sleeps."""
+    limiter = RateLimiter(0)
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05  # nosec B101
+
+
+def test_bulk_gc_restores_threshold():
+    """Test that bulk_gc raises the generation 0 threshold and restores it on exit."""
+    original = gc.get_threshold()
+    try:
+        gc.set_threshold(700, *original[1:])
+        with bulk_gc():
+            assert gc.get_threshold()[0] == parallel.BULK_GC_THRESHOLD  # nosec B101
+        assert gc.get_threshold() == (700, *original[1:])  # nosec B101
+
+        with pytest.raises(RuntimeError):
+            with bulk_gc():
+                raise RuntimeError("boom")
+        assert gc.get_threshold() == (700, *original[1:])  # nosec B101
+    finally:
+        gc.set_threshold(*original)
@@ -1,20 +1,32 @@
 """Utility modules for the GitLab mirroring tool."""
 
-from gitlab_mirror.utils.batch_remove import remove_mirrors_from_csv
-from gitlab_mirror.utils.large_repo_handler import is_large_repository, mirror_large_repository
-from gitlab_mirror.utils.remove import remove_mirrors
-from gitlab_mirror.utils.trigger import process_file, trigger_mirror_sync
-from gitlab_mirror.utils.update import normalize_mirror_url, update_mirrors
-from gitlab_mirror.utils.verify import MirrorVerifier
+import importlib
+from typing import Any
 
-__all__ = [
-    "MirrorVerifier",
-    "trigger_mirror_sync",
-    "process_file",
-    "update_mirrors",
-    "normalize_mirror_url",
-    "remove_mirrors",
-    "remove_mirrors_from_csv",
-    "is_large_repository",
-    "mirror_large_repository",
-]
+# Public name -> defining module; submodules are imported on first attribute access
+# so that importing one utility (or the package for --help) does not load them all.
+_LAZY_IMPORTS = {
+    "MirrorVerifier": "gitlab_mirror.utils.verify",
+    "trigger_mirror_sync": "gitlab_mirror.utils.trigger",
+    "process_file": "gitlab_mirror.utils.trigger",
+    "update_mirrors": "gitlab_mirror.utils.update",
+    "normalize_mirror_url": "gitlab_mirror.utils.update",
+    "remove_mirrors": "gitlab_mirror.utils.remove",
+    "remove_mirrors_from_csv": "gitlab_mirror.utils.batch_remove",
+    "is_large_repository": "gitlab_mirror.utils.large_repo_handler",
+    "mirror_large_repository": "gitlab_mirror.utils.large_repo_handler",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,16 +4,36 @@ Utility module for removing GitLab push mirrors for projects in a CSV file.
 
 import csv
 import logging
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 import gitlab
 from gitlab.exceptions import GitlabGetError
 
+from gitlab_mirror.core.config import configure_http_pool
 from gitlab_mirror.core.exceptions import ConfigError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent API requests
+MAX_WORKERS = 10
+
+
+def _fetch_mirrors(gl: gitlab.Gitlab, project_path: str) -> Optional[List]:
+    """
+    Look up a project and list its push mirrors.
+
+    Returns:
+        List of remote mirrors, or None if the project does not exist
+    """
+    logger.info("Processing project: %s", project_path)
+    try:
+        project = gl.projects.get(project_path)
+    except GitlabGetError:
+        return None
+    return project.remote_mirrors.list(get_all=True, per_page=100)
+
 
 def remove_mirrors_from_csv(
     gitlab_url: str, private_token: str, csv_file: str, dry_run: bool = False
@@ -30,24 +50,16 @@ def remove_mirrors_from_csv(
     Returns:
         Dictionary with summary statistics
     """
-    # Read projects from CSV
-    projects = []
+    # Read projects from CSV, skipping blank cells, comments and a source_path header
     try:
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            # Skip header if present
-            first_line = next(reader, None)
-            if (
-                first_line
-                and not first_line[0].startswith("#")
-                and "source_path" not in str(first_line[0]).lower()
-            ):
-                projects.append(first_line[0].strip())
-
-            for row in reader:
-                if row and len(row) >= 1 and not row[0].startswith("#"):
-                    source_path = row[0].strip()
-                    projects.append(source_path)
+        with open(csv_file, "r", newline="", encoding="utf-8") as f:
+            projects = [
+                source_path
+                for source_path in (row[0].strip() for row in csv.reader(f) if row)
+                if source_path
+                and not source_path.startswith("#")
+                and source_path.lower() != "source_path"
+            ]
 
         logger.info("Found %d projects in CSV file", len(projects))
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -56,6 +68,7 @@ def remove_mirrors_from_csv(
 
     # Initialize GitLab client
     gl = gitlab.Gitlab(url=gitlab_url, private_token=private_token)
+    configure_http_pool(gl.session)
 
     mirrors_removed = 0
     would_remove = 0
@@ -63,48 +76,61 @@ def remove_mirrors_from_csv(
     skipped_projects = 0
     failed_projects = []
 
-    for project_path in projects:
-        try:
-            logger.info("Processing project: %s", project_path)
-
-            # Get project
-            try:
-                project = gl.projects.get(project_path)
-            except GitlabGetError:
-                logger.warning("Project not found: %s", project_path)
-                skipped_projects += 1
-                continue
-
-            processed_projects += 1
-
-            # Get mirrors
-            mirrors = project.remote_mirrors.list()
-
-            if not mirrors:
-                logger.info("No mirrors found for project: %s", project_path)
-                continue
-
-            # Remove mirrors
-            for mirror in mirrors:
-                if dry_run:
-                    logger.info("Would remove mirror %s from %s", mirror.id, project_path)
-                    would_remove += 1
-                else:
-                    try:
-                        mirror.delete()
-                        mirrors_removed += 1
-                        logger.info("Removed mirror %s from %s", mirror.id, project_path)
-                    except Exception as e:  # pylint: disable=broad-exception-caught
-                        logger.error(
-                            "Failed to remove mirror %s from %s: %s", mirror.id, project_path, e
-                        )
-                        failed_projects.append(
-                            {"project": project_path, "mirror_id": mirror.id, "error": str(e)}
-                        )
-
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Error processing project %s: %s", project_path, e)
-            failed_projects.append({"project": project_path, "error": str(e)})
+    # Phase 1: look up projects and their mirrors concurrently
+    to_delete: List[Tuple[str, object]] = []
+    if projects:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(projects))) as executor:
+            futures = {
+                executor.submit(_fetch_mirrors, gl, project_path): project_path
+                for project_path in projects
+            }
+            for future in as_completed(futures):
+                project_path = futures[future]
+                try:
+                    mirrors = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("Error processing project %s: %s", project_path, e)
+                    failed_projects.append({"project": project_path, "error": str(e)})
+                    continue
+
+                if mirrors is None:
+                    logger.warning("Project not found: %s", project_path)
+                    skipped_projects += 1
+                    continue
+
+                processed_projects += 1
+
+                if not mirrors:
+                    logger.info("No mirrors found for project: %s", project_path)
+                    continue
+
+                for mirror in mirrors:
+                    if dry_run:
+                        logger.info("Would remove mirror %s from %s", mirror.id, project_path)
+                        would_remove += 1
+                    else:
+                        to_delete.append((project_path, mirror))
+
+    # Phase 2: delete the collected mirrors concurrently
+    if to_delete:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(to_delete))) as executor:
+            futures = {
+                executor.submit(mirror.delete): (project_path, mirror)
+                for project_path, mirror in to_delete
+            }
+            for future in as_completed(futures):
+                project_path, mirror = futures[future]
+                try:
+                    future.result()
+                    mirrors_removed += 1
+                    logger.info("Removed mirror %s from %s", mirror.id, project_path)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(
+                        "Failed to remove mirror %s from %s: %s", mirror.id, project_path, e
+                    )
+                    failed_projects.append(
+                        {"project": project_path, "mirror_id": mirror.id, "error": str(e)}
+                    )
 
     # Generate summary
     result = {
@@ -13,19 +13,84 @@ import logging
 import os
 import shutil
 import subprocess
+import tempfile
+import threading
 import time
-from typing import List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
-from gitlab_mirror.core.config import get_env_variable
+from gitlab_mirror.core.config import env_bool
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Git settings for transferring large repositories, passed with `git -c`
+GIT_CONFIG = {
+    "http.postBuffer": "1048576000",  # 1GB buffer
+    "http.lowSpeedLimit": "500",  # 500B/s minimum speed
+    "http.lowSpeedTime": "600",  # 10 min timeout
+    "http.receivepack": "true",
+    "pack.windowMemory": "100m",  # Lower memory usage
+    "pack.threads": "1",  # Single thread
+}
+
+# Pack size budget when combining milestones into one push, below GitLab's 2 GB limit
+MAX_PUSH_BYTES = 1536 * 1024 * 1024
+
+# Overrides applied once chunked pushing starts, to handle timeouts better
+PUSH_GIT_CONFIG = {
+    "http.postBuffer": "524288000",  # 500MB buffer
+    "http.lowSpeedLimit": "1000",
+    "http.lowSpeedTime": "300",
+    "push.default": "upstream",
+}
+
+# Server rejection for a push over its pack size limit; retrying the same push cannot help
+PACK_TOO_LARGE_ERROR = "pack exceeds maximum allowed size"
+
+
+# Target state by (target URL, project path): (fetched at, commits, branch tips).
+# Shared across handlers so repeated checks of the same target within the TTL
+# skip the fetch; entries are dropped as soon as a push to that target succeeds.
+_target_state_cache: Dict[Tuple[str, str], Tuple[float, Set[str], Dict[str, str]]] = {}
+TARGET_STATE_TTL = 60.0
+
+# Repository sizes by (GitLab URL, project); only successful lookups are stored
+_repository_sizes: Dict[Tuple[str, str], float] = {}
+
+# Large repositories mirrored at the same time; each is a full clone of up to several GB
+MAX_PARALLEL_LARGE_REPOS = 2
+_large_repo_slots = threading.BoundedSemaphore(MAX_PARALLEL_LARGE_REPOS)
+
+# One lock per clone directory: handlers for the same source project share the
+# directory and its `target` remote, so they must not run at the same time
+_clone_dir_locks: Dict[str, threading.Lock] = {}
+_clone_dir_locks_guard = threading.Lock()
+
+
+def get_clone_dir(source_project_path: str) -> str:
+    """
+    Get the working directory used for a source project, ~/tmp/gitlab_mirror_<path>.
+
+    The name is predictable, so a later run for the same repository reuses the clone.
+    """
+    safe_name = source_project_path.replace("/", "_").replace(".", "_")
+    return os.path.join(os.path.expanduser("~"), "tmp", f"gitlab_mirror_{safe_name}")
+
+
+def _clone_dir_lock(clone_dir: str) -> threading.Lock:
+    """Get the lock serializing the handlers that work in clone_dir."""
+    with _clone_dir_locks_guard:
+        return _clone_dir_locks.setdefault(clone_dir, threading.Lock())
+
 
 def get_repository_size(gitlab_client, project_id: Union[int, str]) -> Optional[float]:
     """
     Get repository size in MB using multiple fallback methods.
 
+    Sizes are remembered per GitLab instance and project for the rest of the
+    process; failed lookups are not, so they are retried on the next call.
+
     Args:
         gitlab_client: GitLab client instance
         project_id_or_path: Project ID or path
@@ -33,6 +98,10 @@ def get_repository_size(gitlab_client, project_id: Union[int, str]) -> Optional[
     Returns:
         Repository size in MB, or None if size couldn't be determined
     """
+    cache_key = (str(getattr(gitlab_client, "url", id(gitlab_client))), str(project_id))
+    if cache_key in _repository_sizes:
+        return _repository_sizes[cache_key]
+
     try:
         response = gitlab_client.http_get(f"/projects/{project_id}?statistics=true")
 
@@ -40,7 +109,9 @@ def get_repository_size(gitlab_client, project_id: Union[int, str]) -> Optional[
             stats = response["statistics"]
             if "repository_size" in stats:
                 # GitLab returns size in bytes, convert to MB
-                return stats["repository_size"] / (1024.0 * 1024.0)
+                size_mb = stats["repository_size"] / (1024.0 * 1024.0)
+                _repository_sizes[cache_key] = size_mb
+                return size_mb
     except Exception as e:
         logger.debug("Method 3 failed: %s", e)
 
@@ -75,8 +146,7 @@ def is_large_repository(
         )
 
         # Check if environment variable is set to force large repo handling
-        force_large = get_env_variable("FORCE_LARGE_REPO_HANDLING", required=False)
-        if force_large and force_large.lower() in ("true", "yes", "1"):
+        if env_bool("FORCE_LARGE_REPO_HANDLING"):
             logger.info(
                 "FORCE_LARGE_REPO_HANDLING is enabled. Treating repository %s as large.", project_id
             )
@@ -91,6 +161,56 @@ def is_large_repository(
         return False
 
 
+class _GitBatch:
+    """
+    A long-running git process that answers one line of stdin with one line of stdout.
+
+    Used for batch commands such as `git cat-file --batch-check`, so repeated
+    lookups share one process instead of starting git for each. The process is
+    started on the first query and restarted if it has exited.
+    """
+
+    def __init__(self, command: List[str], cwd: Optional[str], env: Dict[str, str]):
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self._proc: Optional[subprocess.Popen] = None
+
+    def query(self, line: str) -> str:
+        """
+        Send one query line and return the answer line without its newline.
+
+        Raises:
+            OSError: If the process cannot be started or its pipes are closed
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                self.command,
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self.env,
+                universal_newlines=True,
+                bufsize=1,
+            )
+        self._proc.stdin.write(line + "\n")
+        self._proc.stdin.flush()
+        return self._proc.stdout.readline().rstrip("\n")
+
+    def close(self) -> None:
+        """Stop the process, if running."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            proc.kill()
+            proc.wait()
+
+
 class LargeRepoHandler:
     """Handles mirroring of large repositories that exceed the 2 GB push limit."""
 
@@ -134,22 +254,27 @@ class LargeRepoHandler:
         self.git_env = os.environ.copy()
         # Add custom environment variables for Git if needed
         self.git_env["GIT_TERMINAL_PROMPT"] = "0"  # Disable Git prompts
+        # Budget for combining milestones into one push; halved if a pack is rejected
+        self.max_push_bytes = MAX_PUSH_BYTES
+        # Settings passed to every git command via -c instead of writing git config
+        self.git_config = dict(GIT_CONFIG)
+        # Milestones per step; the source history doesn't change during a session
+        self._milestones_cache: Dict[int, List[str]] = {}
+        # Key of this target in _target_state_cache
+        self._target_key = (self.target_url, self.target_project_path)
+        # Target branch tips ("target/<branch>" -> SHA) from the last target fetch
+        self._target_tips: Dict[str, str] = {}
+        # Long-running `git cat-file --batch-check`, created on first object lookup
+        self._cat_file: Optional[_GitBatch] = None
 
     def __enter__(self):
         """Context manager entry point."""
-        # Create temp directory in ~/tmp/ folder
-        home_dir = os.path.expanduser("~")
-        tmp_dir = os.path.join(home_dir, "tmp")
-
-        # Ensure the ~/tmp directory exists
-        os.makedirs(tmp_dir, exist_ok=True)
+        # Create temp directory in ~/tmp/ folder, reused for the same repository
+        repo_temp_dir = get_clone_dir(self.source_project_path)
+        # Checked once; makedirs below creates ~/tmp along with the directory
+        temp_dir_exists = os.path.exists(repo_temp_dir)
 
-        # Create a predictable directory name based on the project path
-        # This allows us to reuse the same directory for the same repository
-        safe_name = self.source_project_path.replace("/", "_").replace(".", "_")
-        repo_temp_dir = os.path.join(tmp_dir, f"gitlab_mirror_{safe_name}")
-
-        if os.path.exists(repo_temp_dir) and self.keep_temp_dir:
+        if temp_dir_exists and self.keep_temp_dir:
             # If directory exists and we're keeping temp dirs, use it
             logger.info("Using existing temporary directory: %s", repo_temp_dir)
             self.temp_dir = repo_temp_dir
@@ -158,7 +283,7 @@ class LargeRepoHandler:
                 logger.info("Found existing repository clone in temporary directory")
         else:
             # Otherwise create a new temporary directory
-            if os.path.exists(repo_temp_dir):
+            if temp_dir_exists:
                 logger.info("Removing old temporary directory: %s", repo_temp_dir)
                 shutil.rmtree(repo_temp_dir, ignore_errors=True)
 
@@ -171,6 +296,7 @@ class LargeRepoHandler:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit point to clean up resources."""
+        self._close_cat_file()
         if not self.keep_temp_dir:
             if self.temp_dir and os.path.exists(self.temp_dir):
                 logger.info("Removing temporary directory: %s", self.temp_dir)
@@ -179,7 +305,7 @@ class LargeRepoHandler:
             logger.info("Keeping temporary directory: %s", self.temp_dir)
 
     def run_git_command(
-        self, command: List[str], cwd: Optional[str] = None
+        self, command: List[str], cwd: Optional[str] = None, input_text: Optional[str] = None
     ) -> Tuple[int, str, str]:
         """
         Run a git command and return its output.
@@ -187,6 +313,7 @@ class LargeRepoHandler:
         Args:
             command: Git command as a list of strings
             cwd: Working directory for the command
+            input_text: Text to send to the command's stdin
 
         Returns:
             Tuple of (return_code, stdout, stderr)
@@ -195,20 +322,140 @@ class LargeRepoHandler:
         logger.debug("Running git command: %s in %s", " ".join(command), working_dir)
 
         try:
-            process = subprocess.Popen(
-                command,
+            result = subprocess.run(
+                self._with_git_config(command),
                 cwd=working_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                input=input_text,
+                capture_output=True,
+                text=True,
                 env=self.git_env,
-                universal_newlines=True,
+                check=False,
             )
-            stdout, stderr = process.communicate()
-            return process.returncode, stdout, stderr
-        except subprocess.SubprocessError as e:
+        except (OSError, subprocess.SubprocessError) as e:
+            # OSError covers a missing git executable or working directory
             logger.error("Git command failed: %s", e)
             return 1, "", str(e)
 
+        if result.returncode == 0 and command[1:2] == ["push"]:
+            # The target changed, so the next lookup has to fetch it again
+            _target_state_cache.pop(self._target_key, None)
+        return result.returncode, result.stdout, result.stderr
+
+    def run_git_command_lines(
+        self,
+        command: List[str],
+        cwd: Optional[str] = None,
+        keep_newlines: bool = False,
+        input_text: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Run a git command and yield its stdout line by line as it is produced.
+
+        Unlike run_git_command, the output is never held in memory as a whole.
+
+        Args:
+            command: Git command as a list of strings
+            cwd: Working directory for the command
+            keep_newlines: Yield lines as read, for callers that only use a few of them
+            input_text: Text to send to the command's stdin before reading its output
+
+        Yields:
+            Output lines, without the trailing newline unless keep_newlines is set
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits with an error
+        """
+        working_dir = cwd or self.temp_dir
+        logger.debug("Streaming git command: %s in %s", " ".join(command), working_dir)
+
+        # stderr goes to a file so a chatty command can't block on a full pipe
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            with subprocess.Popen(
+                self._with_git_config(command),
+                cwd=working_dir,
+                stdin=None if input_text is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                env=self.git_env,
+                universal_newlines=True,
+                bufsize=1 << 20,
+            ) as process:
+                if input_text is not None:
+                    process.stdin.write(input_text)
+                    process.stdin.close()
+                if keep_newlines:
+                    yield from process.stdout
+                else:
+                    for line in process.stdout:
+                        yield line.rstrip("\n")
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    process.returncode, command, stderr=stderr_file.read()
+                )
+
+    def _with_git_config(self, command: List[str]) -> List[str]:
+        """Insert `-c key=value` for each entry of git_config into a git command."""
+        if command[:1] != ["git"]:
+            return command
+        config_args = []
+        for key, value in self.git_config.items():
+            config_args += ["-c", f"{key}={value}"]
+        return ["git", *config_args, *command[1:]]
+
+    def _local_branches(self) -> Optional[List[str]]:
+        """
+        List local branch names.
+
+        Returns:
+            Branch names, or None if they could not be listed
+        """
+        # for-each-ref prints bare names, unlike `git branch` with its "* " marker
+        # and "(HEAD detached ...)" entries
+        branch_cmd = ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"]
+        return_code, stdout, stderr = self.run_git_command(branch_cmd)
+
+        if return_code != 0:
+            logger.error("Failed to list branches: %s", stderr)
+            return None
+
+        return stdout.split()
+
+    def resolve_object(self, name: str) -> Optional[str]:
+        """
+        Resolve a revision (ref, HEAD, abbreviated SHA) to its full object name.
+
+        Lookups go through one persistent `git cat-file --batch-check` process
+        instead of spawning `git rev-parse` each time.
+
+        Args:
+            name: Revision to resolve
+
+        Returns:
+            Full object name, or None if it does not exist
+        """
+        if self._cat_file is None:
+            self._cat_file = _GitBatch(
+                ["git", "cat-file", "--batch-check=%(objectname)"], self.temp_dir, self.git_env
+            )
+        try:
+            line = self._cat_file.query(name)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error("Failed to resolve %s: %s", name, e)
+            self._close_cat_file()
+            return None
+
+        # Unknown names are echoed back as "<name> missing" (or "ambiguous")
+        if not line or " " in line:
+            return None
+        return line
+
+    def _close_cat_file(self) -> None:
+        """Stop the persistent cat-file process, if running."""
+        batch, self._cat_file = self._cat_file, None
+        if batch is not None:
+            batch.close()
+
     def clone_source_repo(self) -> bool:
         """
         Clone the source repository with access token authentication.
@@ -222,19 +469,6 @@ class LargeRepoHandler:
             f"https://oauth2:{self.source_token}@{self.source_url}/{self.source_project_path}.git"
         )
 
-        # Set Git config to handle large repos better
-        config_cmds = [
-            ["git", "config", "--global", "http.postBuffer", "1048576000"],  # 1GB buffer
-            ["git", "config", "--global", "http.lowSpeedLimit", "500"],  # 500B/s minimum speed
-            ["git", "config", "--global", "http.lowSpeedTime", "600"],  # 10 min timeout
-            ["git", "config", "--global", "http.receivepack", "true"],
-            ["git", "config", "--global", "pack.windowMemory", "100m"],  # Lower memory usage
-            ["git", "config", "--global", "pack.threads", "1"],  # Single thread
-        ]
-
-        for cmd in config_cmds:
-            self.run_git_command(cmd)
-
         if self.repo_already_cloned:
             logger.info("Repository already cloned, updating instead of re-cloning")
 
@@ -290,25 +524,20 @@ class LargeRepoHandler:
             logger.info("Successfully updated repository")
             return True
         else:
-            # Clone with depth 1 first to get repository structure faster
-            logger.info("Performing shallow clone first to get repository structure")
-            shallow_clone_cmd = ["git", "clone", "--depth", "1", source_repo_url, "."]
-            return_code, _, stderr = self.run_git_command(shallow_clone_cmd)
+            # Only the object database is needed to push commits, so skip the checkout;
+            # a single clone also avoids the separate depth-1 clone + unshallow round trip
+            clone_cmd = ["git", "clone", "--no-checkout"]
+            if self.shallow:
+                clone_cmd += ["--depth", "1"]
+            clone_cmd += [source_repo_url, "."]
+
+            logger.info("Cloning source repository")
+            return_code, _, stderr = self.run_git_command(clone_cmd)
 
             if return_code != 0:
                 logger.error("Failed to clone repository: %s", stderr)
                 return False
 
-            # Then fetch the rest if this is not a shallow migration
-            if not self.shallow:
-                logger.info("Fetching complete repository history")
-                fetch_cmd = ["git", "fetch", "--unshallow"]
-                return_code, _, stderr = self.run_git_command(fetch_cmd)
-
-                if return_code != 0:
-                    logger.error("Failed to fetch complete repository: %s", stderr)
-                    return False
-
             logger.info("Successfully cloned source repository")
             return True
 
@@ -353,27 +582,55 @@ class LargeRepoHandler:
             )
             return False
 
-        # Verify that the remote now exists and has the correct URL
-        verify_cmd = ["git", "remote", "get-url", "target"]
-        return_code, stdout, stderr = self.run_git_command(verify_cmd)
-
-        if return_code != 0:
-            logger.error("Failed to verify target remote: %s", stderr)
-            return False
-
         logger.info(
             "Target remote successfully configured with URL: %s",
             target_repo_url.replace(self.target_token, "***TOKEN***"),
         )
         return True
 
+    def _list_target_heads(self) -> Optional[Dict[str, str]]:
+        """
+        List the target's branches with `git ls-remote`, without a local repository.
+
+        Returns:
+            Mapping of branch ref to commit SHA, or None if the listing failed
+        """
+        target_repo_url = (
+            f"https://oauth2:{self.target_token}@{self.target_url}/{self.target_project_path}.git"
+        )
+        return_code, stdout, stderr = self.run_git_command(
+            ["git", "ls-remote", "--heads", target_repo_url]
+        )
+        if return_code != 0:
+            logger.debug(
+                "Could not list target branches: %s",
+                stderr.replace(self.target_token, "***TOKEN***"),
+            )
+            return None
+
+        heads = {}
+        for line in stdout.splitlines():
+            sha, _, ref = line.partition("\t")
+            heads[ref] = sha
+        return heads
+
     def find_already_pushed_commits(self) -> set:
         """
         Determine which commits have already been pushed to the target repository.
+
+        The result is reused for TARGET_STATE_TTL seconds or until the next
+        successful push, so repeated checks don't fetch from the target again
+        when nothing has changed.
         
         Returns:
             Set of commit SHAs that exist in the target repository
         """
+        cached = _target_state_cache.get(self._target_key)
+        if cached is not None and time.monotonic() - cached[0] < TARGET_STATE_TTL:
+            logger.info("Using cached list of commits already on target repository")
+            _, target_commits, self._target_tips = cached
+            return target_commits
+
         logger.info("Checking for commits already pushed to target repository")
         
         # First, make sure the target remote is set up correctly
@@ -392,20 +649,26 @@ class LargeRepoHandler:
         else:
             logger.info("Successfully fetched from target repository")
         
-        # List remote branches to find target branches
-        remote_branches_cmd = ["git", "branch", "-r"]
-        return_code, stdout, stderr = self.run_git_command(remote_branches_cmd)
+        # List target branch tips in one call
+        ref_cmd = [
+            "git",
+            "for-each-ref",
+            "--format=%(objectname) %(refname:short)",
+            "refs/remotes/target/",
+        ]
+        return_code, stdout, stderr = self.run_git_command(ref_cmd)
         
         if return_code != 0:
             logger.warning("Failed to list remote branches: %s", stderr)
             return set()
         
-        # Extract only target branches
-        target_branches = []
+        tips = {}
         for line in stdout.splitlines():
-            branch = line.strip()
-            if branch.startswith("target/"):
-                target_branches.append(branch)
+            sha, _, branch = line.partition(" ")
+            if branch:
+                tips[branch] = sha
+        self._target_tips = tips
+        target_branches = list(tips)
         
         logger.info("Found %d target branches: %s", len(target_branches), target_branches)
         
@@ -413,127 +676,207 @@ class LargeRepoHandler:
             logger.info("No branches found on target repository")
             return set()
         
-        # Get commit count using rev-list on target/master
-        if "target/master" in target_branches:
-            count_cmd = ["git", "rev-list", "--count", "target/master"]
-            return_code, stdout, stderr = self.run_git_command(count_cmd)
-            
-            if return_code == 0:
-                commit_count = int(stdout.strip())
-                logger.info("Target repository has %d commits on master branch", commit_count)
-            else:
-                logger.warning("Failed to get commit count: %s", stderr)
-        
-        # Get all commit SHAs from target branches
-        target_commits = set()
-        for branch in target_branches:
-            logger.info("Getting commits from branch: %s", branch)
-            rev_list_cmd = ["git", "rev-list", branch]
-            return_code, stdout, stderr = self.run_git_command(rev_list_cmd)
-            
-            if return_code != 0:
-                logger.warning("Failed to get commit list for branch %s: %s", branch, stderr)
-                continue
-            
-            # Count commits in this branch
-            branch_commits = 0
-            # Add all commit SHAs to our set
-            for commit_sha in stdout.splitlines():
-                if commit_sha.strip():
-                    target_commits.add(commit_sha.strip())
-                    branch_commits += 1
-            
-            logger.info("Added %d commits from branch %s", branch_commits, branch)
+        # Walk the history of all tips at once rather than one rev-list per branch
+        # and stream it, so only the set of SHAs is held in memory
+        rev_list_cmd = ["git", "rev-list", "--stdin"]
+        try:
+            target_commits = set(
+                self.run_git_command_lines(
+                    rev_list_cmd, input_text="\n".join(set(tips.values())) + "\n"
+                )
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(
+                "Failed to get commit list for target branches: %s", getattr(e, "stderr", e)
+            )
+            return set()
+
+        _target_state_cache[self._target_key] = (time.monotonic(), target_commits, tips)
         
         logger.info("Found %d total unique commits already pushed to target repository", len(target_commits))
         
         return target_commits
 
+    def push_all_refs(self, max_retries: int = 3, parallel: int = 4) -> bool:
+        """
+        Push all local branches and tags to the target.
+
+        The refs are split into groups pushed by parallel `git push` processes,
+        so each pack stays smaller and a failure only retries its own group.
+        Branches whose tip already matches the target are skipped.
+
+        Args:
+            max_retries: Attempts per group of refs
+            parallel: Maximum number of concurrent pushes
+
+        Returns:
+            True if every group was pushed, False otherwise
+        """
+        ref_cmd = [
+            "git",
+            "for-each-ref",
+            "--format=%(objectname) %(refname)",
+            "refs/heads",
+            "refs/tags",
+        ]
+        return_code, stdout, stderr = self.run_git_command(ref_cmd)
+
+        if return_code != 0:
+            logger.warning("Failed to list local refs: %s", stderr)
+            return False
+
+        refspecs = []
+        for line in stdout.splitlines():
+            sha, _, ref = line.partition(" ")
+            if ref.startswith("refs/heads/"):
+                if self._target_tips.get("target/" + ref[len("refs/heads/"):]) == sha:
+                    continue
+            refspecs.append(f"+{ref}:{ref}")
+
+        if not refspecs:
+            logger.info("All refs are already up to date on target")
+            return True
+
+        groups = min(parallel, len(refspecs))
+        logger.info("Pushing %d refs in %d parallel groups", len(refspecs), groups)
+        with ThreadPoolExecutor(max_workers=groups) as executor:
+            results = list(
+                executor.map(
+                    lambda group: self._push_refspecs(group, max_retries),
+                    [refspecs[i::groups] for i in range(groups)],
+                )
+            )
+        return all(results)
+
+    def _push_refspecs(self, refspecs: List[str], max_retries: int) -> bool:
+        """Push a group of refspecs to the target, retrying on failure."""
+        return_code, _, stderr = self._retry(
+            ["git", "push", "target", *refspecs], attempts=max_retries
+        )
+        if return_code == 0:
+            return True
+        logger.warning(
+            "Pushing %d refs failed after %d attempts: %s", len(refspecs), max_retries, stderr
+        )
+        return False
+
+    def _retry(
+        self, command: List[str], attempts: int = 3, base: float = 5.0
+    ) -> Tuple[int, str, str]:
+        """
+        Run a git command, retrying failures with exponential backoff.
+
+        A push rejected for exceeding the pack size limit is returned at once,
+        since sending the same pack again would fail the same way.
+
+        Args:
+            command: Git command as a list of strings
+            attempts: Maximum number of attempts
+            base: Seconds to wait before the first retry, doubled for each further one
+
+        Returns:
+            Tuple of (return_code, stdout, stderr) from the last attempt
+        """
+        for attempt in range(1, attempts + 1):
+            return_code, stdout, stderr = self.run_git_command(command)
+            if return_code == 0 or attempt == attempts or PACK_TOO_LARGE_ERROR in stderr:
+                break
+            backoff_time = base * 2 ** (attempt - 1)  # 5s, 10s, 20s...
+            logger.warning(
+                "Attempt %d of %s failed, retrying in %.0f seconds",
+                attempt,
+                " ".join(command[:2]),
+                backoff_time,
+            )
+            time.sleep(backoff_time)
+        return return_code, stdout, stderr
+
     def push_in_chunks(self, step: int = 200) -> bool:
         """Push the repository in chunks to avoid the 2 GB limit."""
-        # Find all milestone commits
-        milestones = self.find_milestones(step)
+        # Walking the local history and fetching from the target are independent,
+        # so find the milestones in the background while the target is checked
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            milestones_future = executor.submit(self.find_milestones, step)
+
+            # Find what branch we're working with
+            available_branches = self._local_branches() or []
+            branch = "main"  # Default
+
+            if "main" in available_branches:
+                branch = "main"
+            elif "master" in available_branches:
+                branch = "master"
+            elif available_branches:
+                branch = available_branches[0]
+
+            logger.info("Using branch %s for pushing", branch)
+
+            # Set up target remote - this must succeed before we continue
+            if not self.setup_target_remote():
+                logger.error("Failed to set up target remote for pushing")
+                return False
+
+            # Get commits that already exist on the target
+            already_pushed_commits = self.find_already_pushed_commits()
+            logger.info(
+                "Found %d commits already pushed to target repository",
+                len(already_pushed_commits),
+            )
+
+            # Find all milestone commits
+            milestones = milestones_future.result()
         
         if not milestones:
             logger.error("No milestone commits found")
             return False
         
         logger.info("Found %d milestone commits", len(milestones))
-        logger.debug("Milestone commits: %s", milestones[:10])  # Log first 10 for debugging
-        
-        # Find what branch we're working with
-        branch_check_cmd = ["git", "branch"]
-        _, stdout, _ = self.run_git_command(branch_check_cmd)
-        available_branches = [b.strip().replace('* ', '') for b in stdout.strip().split("\n") if b.strip()]
-        branch = "main"  # Default
-        
-        if "main" in available_branches:
-            branch = "main"
-        elif "master" in available_branches:
-            branch = "master"
-        elif available_branches:
-            branch = available_branches[0]
-        
-        logger.info("Using branch %s for pushing", branch)
-        
-        # Set up target remote - this must succeed before we continue
-        if not self.setup_target_remote():
-            logger.error("Failed to set up target remote for pushing")
-            return False
-        
-        # Get commits that already exist on the target
-        already_pushed_commits = self.find_already_pushed_commits()
-        logger.info("Found %d commits already pushed to target repository", len(already_pushed_commits))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Milestone commits: %s", milestones[:10])  # Log first 10 for debugging
         
         # Force re-push the latest commit to ensure we're up to date
         logger.info("Getting latest commit from source branch")
-        latest_cmd = ["git", "rev-parse", "HEAD"]
-        return_code, stdout, stderr = self.run_git_command(latest_cmd)
+        latest_commit = self.resolve_object("HEAD")
+        latest_pushed = False
         
-        if return_code == 0 and stdout.strip():
-            latest_commit = stdout.strip()
+        if latest_commit:
             logger.info("Latest commit is %s - force pushing to target", latest_commit)
             
             # Force push the latest commit to ensure we're making progress
             push_latest_cmd = ["git", "push", "target", f"+{latest_commit}:refs/heads/{branch}"]
+            # Tried once: for a repository this large, a failed full push (pack size
+            # limit, proxy 413, hung-up remote) fails again, and the milestones follow
             return_code, stdout, stderr = self.run_git_command(push_latest_cmd)
             
             if return_code == 0:
                 logger.info("Successfully force-pushed latest commit to target")
+                latest_pushed = True
             else:
                 logger.warning("Failed to force-push latest commit: %s", stderr)
 
         # Set Git push options to handle timeouts better
-        push_config_cmds = [
-            ["git", "config", "http.postBuffer", "524288000"],  # 500MB buffer
-            ["git", "config", "http.lowSpeedLimit", "1000"],
-            ["git", "config", "http.lowSpeedTime", "300"],
-            ["git", "config", "push.default", "upstream"],
-        ]
-        
-        for cmd in push_config_cmds:
-            self.run_git_command(cmd)
+        self.git_config.update(PUSH_GIT_CONFIG)
         
-        # Check if the latest milestone is already pushed
-        if milestones and milestones[-1] in already_pushed_commits:
-            logger.info("Latest milestone commit %s already exists on target. Repository is up to date.", milestones[-1])
-            
-            # Do a final mirror push to ensure all refs are synchronized
-            logger.info("Performing final mirror push for all refs")
-            mirror_cmd = ["git", "push", "target", "--mirror", "--force"]
+        # Work out once which milestones still have to be pushed. Milestones are
+        # ancestors of HEAD, so once HEAD is on the target every one of them is too
+        if latest_pushed:
+            to_push = []
+        else:
+            to_push = [sha for sha in milestones if sha not in already_pushed_commits]
+        if len(to_push) < len(milestones):
+            logger.info(
+                "Skipping %d milestone commits already on target", len(milestones) - len(to_push)
+            )
+
+        if not to_push:
+            logger.info("All milestone commits already exist on target. Repository is up to date.")
             
-            max_retries = 3
-            for attempt in range(1, max_retries + 1):
-                mirror_code, _, mirror_stderr = self.run_git_command(mirror_cmd)
-                
-                if mirror_code == 0:
-                    logger.info("Successfully completed mirror push")
-                    break
-                elif attempt < max_retries:
-                    logger.warning("Mirror push attempt %d failed. Retrying...", attempt)
-                    time.sleep(5)
-                else:
-                    logger.warning("Final mirror push had issues after %d attempts: %s", max_retries, mirror_stderr)
+            # Do a final push to ensure all refs are synchronized
+            logger.info("Performing final push for all refs")
+            if self.push_all_refs():
+                logger.info("Successfully pushed all refs")
+            else:
+                logger.warning("Final push of all refs had issues")
             
             return True
         
@@ -541,44 +884,34 @@ class LargeRepoHandler:
         success = True
         max_retries = 3
         commits_pushed = 0
-        for commit_sha in milestones:
-            # Skip if already pushed
-            if commit_sha in already_pushed_commits:
-                logger.info("Skipping milestone commit %s - already exists on target", commit_sha)
-                continue
-                
+        for commit_sha in self._select_push_points(to_push):
             logger.info("Pushing milestone commit: %s", commit_sha)
             # Use force push with the + prefix to overcome non-fast-forward errors
             push_cmd = ["git", "push", "target", f"+{commit_sha}:refs/heads/{branch}"]
             
-            # Try up to 3 times
-            for attempt in range(1, max_retries + 1):
-                return_code, _, stderr = self.run_git_command(push_cmd)
+            return_code, _, stderr = self._retry(push_cmd, attempts=max_retries)
+
+            if return_code == 0:
+                logger.info("Successfully pushed milestone %s", commit_sha)
+                commits_pushed += 1
+                logger.info("Commits pushed in this session: %d", commits_pushed)
+            elif PACK_TOO_LARGE_ERROR in stderr:
+                logger.warning("Pack size exceeded at commit %s, reducing step size", commit_sha)
+                self.max_push_bytes //= 2
+                # Reduce step size and try again with just this segment
+                smaller_step = max(50, step // 2)  # Even smaller steps
+                logger.info("Retrying with smaller step size: %d", smaller_step)
                 
-                if return_code == 0:
-                    logger.info("Successfully pushed milestone %s", commit_sha)
-                    # Add to our set of already pushed commits
-                    already_pushed_commits.add(commit_sha)
-                    commits_pushed += 1
-                    logger.info("Commits pushed in this session: %d", commits_pushed)
-                    break
-                elif attempt < max_retries:
-                    logger.warning("Push attempt %d failed for %s. Retrying...", attempt, commit_sha)
-                    backoff_time = 5 * (2**(attempt-1))  # 5s, 10s, 20s...
-                    logger.info("Exponential backoff: Waiting %d seconds before retry", backoff_time)
-                    time.sleep(backoff_time)
-                else:
-                    if "pack exceeds maximum allowed size" in stderr:
-                        logger.warning("Pack size exceeded at commit %s, reducing step size", commit_sha)
-                        # Reduce step size and try again with just this segment
-                        smaller_step = max(50, step // 2)  # Even smaller steps
-                        logger.info("Retrying with smaller step size: %d", smaller_step)
-                        
-                        # Recursively call with smaller step
-                        return self.push_in_chunks(step=smaller_step)
-                    else:
-                        logger.error("Failed to push milestone %s after %d attempts: %s", commit_sha, max_retries, stderr)
-                        success = False
+                # Recursively call with smaller step
+                return self.push_in_chunks(step=smaller_step)
+            else:
+                logger.error(
+                    "Failed to push milestone %s after %d attempts: %s",
+                    commit_sha,
+                    max_retries,
+                    stderr,
+                )
+                success = False
         
         logger.info("Finished pushing milestones. Total commits pushed in this session: %d", commits_pushed)
         
@@ -586,22 +919,13 @@ class LargeRepoHandler:
         after_push_commits = self.find_already_pushed_commits()
         logger.info("After pushing all milestones, found %d commits on target", len(after_push_commits))
         
-        # Final mirror push for any remaining refs - also with retry
-        logger.info("Performing final mirror push for all refs")
-        mirror_cmd = ["git", "push", "target", "--mirror", "--force"]
-        
-        for attempt in range(1, max_retries + 1):
-            mirror_code, _, mirror_stderr = self.run_git_command(mirror_cmd)
-            
-            if mirror_code == 0:
-                logger.info("Successfully completed mirror push")
-                break
-            elif attempt < max_retries:
-                logger.warning("Mirror push attempt %d failed. Retrying...", attempt)
-                time.sleep(5)
-            else:
-                logger.warning("Final mirror push had issues after %d attempts: %s", max_retries, mirror_stderr)
-                # Don't fail the whole operation for this - we already pushed the main branch
+        # Final push for any remaining refs - also with retry
+        logger.info("Performing final push for all refs")
+        if self.push_all_refs(max_retries=max_retries):
+            logger.info("Successfully pushed all refs")
+        else:
+            # Don't fail the whole operation for this - we already pushed the main branch
+            logger.warning("Final push of all refs had issues")
         
         # Final verification after mirror push
         final_commits = self.find_already_pushed_commits()
@@ -609,6 +933,63 @@ class LargeRepoHandler:
         
         return success
 
+    def _select_push_points(self, pending: List[str]) -> List[str]:
+        """
+        Choose which milestones to push, combining consecutive ones into one push.
+
+        Pushing a commit also sends all of its ancestors, so a run of consecutive
+        milestones is pushed by pushing only the last one, as long as their new
+        objects fit in max_push_bytes. Sizes come from `git rev-list --disk-usage`
+        (git 2.31+); if it is unavailable every milestone is pushed on its own.
+
+        Args:
+            pending: Milestone commits not yet on the target, oldest first
+
+        Returns:
+            Milestone commits to push, oldest first
+        """
+        push_points = []
+        batch_sha = None
+        batch_bytes = 0
+        previous = None
+        for sha in pending:
+            # Objects this milestone adds on top of the previous one and the target
+            size_cmd = [
+                "git",
+                "rev-list",
+                "--objects",
+                "--disk-usage",
+                sha,
+                "--not",
+                "--remotes=target",
+            ]
+            if previous:
+                size_cmd.append(previous)
+            return_code, stdout, stderr = self.run_git_command(size_cmd)
+            try:
+                size = int(stdout) if return_code == 0 else None
+            except ValueError:
+                size = None
+            if size is None:
+                logger.debug("Cannot estimate push sizes, pushing every milestone: %s", stderr)
+                return pending
+
+            if batch_sha and batch_bytes + size > self.max_push_bytes:
+                push_points.append(batch_sha)
+                batch_bytes = 0
+            batch_sha = sha
+            batch_bytes += size
+            previous = sha
+
+        if batch_sha:
+            push_points.append(batch_sha)
+
+        if len(push_points) < len(pending):
+            logger.info(
+                "Combined %d milestone commits into %d pushes", len(pending), len(push_points)
+            )
+        return push_points
+
     def find_milestones(self, step: int = 1000) -> List[str]:
         """
         Find milestone commits for incremental pushing.
@@ -619,17 +1000,15 @@ class LargeRepoHandler:
         Returns:
             List of commit SHAs to use as milestones
         """
+        if step in self._milestones_cache:
+            return self._milestones_cache[step]
+
         # First, check what branches exist in the repository
-        branch_check_cmd = ["git", "branch"]
-        return_code, stdout, stderr = self.run_git_command(branch_check_cmd)
+        available_branches = self._local_branches()
 
-        if return_code != 0:
-            logger.error("Failed to list branches: %s", stderr)
+        if available_branches is None:
             return []
 
-        available_branches = [
-            b.strip().replace("* ", "") for b in stdout.strip().split("\n") if b.strip()
-        ]
         logger.info("Available branches: %s", available_branches)
 
         # Try to find the default branch
@@ -661,29 +1040,29 @@ class LargeRepoHandler:
 
         # Find milestone commits
         logger.info("Finding milestone commits on branch: %s", default_branch)
-        log_cmd = ["git", "log", "--oneline", "--reverse", default_branch]
-        return_code, stdout, stderr = self.run_git_command(log_cmd)
-
-        if return_code != 0:
-            logger.error("Failed to get commit log: %s", stderr)
+        # Stream raw SHAs and keep every step-th one instead of buffering the whole log
+        rev_list_cmd = ["git", "rev-list", "--reverse", default_branch]
+        milestones = []
+        i = -1
+        try:
+            # Only the selected lines are stripped; the rest are just counted
+            lines = self.run_git_command_lines(rev_list_cmd, keep_newlines=True)
+            for i, line in enumerate(lines):
+                if i % step == 0:
+                    milestones.append(line.rstrip("\n"))
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error("Failed to get commit log: %s", getattr(e, "stderr", None) or e)
             return []
 
-        all_commits = [line for line in stdout.strip().split("\n") if line.strip()]
+        total_commits = i + 1
 
-        if not all_commits:
+        if not total_commits:
             logger.error("No commits found in branch %s", default_branch)
             return []
 
-        logger.info("Found %d total commits", len(all_commits))
-
-        # Create milestone list
-        milestones = []
-        for i, line in enumerate(all_commits):
-            if i % step == 0 and line:
-                commit_sha = line.split(" ")[0]
-                milestones.append(commit_sha)
-
+        logger.info("Found %d total commits", total_commits)
         logger.info("Created %d milestone commits", len(milestones))
+        self._milestones_cache[step] = milestones
         return milestones
 
     def mirror_large_repo(self, step: int = 1000) -> bool:
@@ -704,9 +1083,18 @@ class LargeRepoHandler:
                 step
             )
             
-            # Clone the source repository
-            if not self.clone_source_repo():
-                return False
+            # Clone the source repository while the target's branches are listed;
+            # the clone is bound by source bandwidth and the listing by target latency
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                target_heads_future = executor.submit(self._list_target_heads)
+                if not self.clone_source_repo():
+                    return False
+                target_heads = target_heads_future.result()
+
+            if target_heads == {}:
+                # Nothing on the target yet, so there is no need to fetch from it
+                logger.info("Target repository has no branches yet")
+                _target_state_cache[self._target_key] = (time.monotonic(), set(), {})
                 
             # Set up the target remote
             if not self.setup_target_remote():
@@ -772,7 +1160,18 @@ class LargeRepoHandler:
             if not self.repo_already_cloned:
                 # Clone source repository with depth=1 (only latest commit)
                 source_repo_url = f"https://oauth2:{self.source_token}@{self.source_url}/{self.source_project_path}.git"
-                clone_cmd = ["git", "clone", "--depth", "1", source_repo_url, "."]
+                # The push needs every blob of the commit, so no --filter=blob:none;
+                # skipping the checkout and tags still saves disk writes and transfer
+                clone_cmd = [
+                    "git",
+                    "clone",
+                    "--depth",
+                    "1",
+                    "--no-checkout",
+                    "--no-tags",
+                    source_repo_url,
+                    ".",
+                ]
 
                 logger.info("Performing shallow clone of: %s", self.source_project_path)
                 return_code, _, stderr = self.run_git_command(clone_cmd)
@@ -864,6 +1263,10 @@ def mirror_large_repository(
     """
     Mirror a large repository from source to target GitLab instance.
 
+    Safe to call from several threads: mappings of the same source project run
+    one after another, since they share a clone directory, and at most
+    MAX_PARALLEL_LARGE_REPOS repositories are mirrored at once.
+
     Args:
         source_url: Source GitLab instance URL
         source_project_path: Full path of source project with namespace
@@ -886,18 +1289,21 @@ def mirror_large_repository(
             shallow,
         )
 
-        with LargeRepoHandler(
-            source_url,
-            source_project_path,
-            source_token,
-            target_url,
-            target_project_path,
-            target_token,
-            chunk_size=chunk_size,
-            shallow=shallow,
-            keep_temp_dir=keep_temp_dir,
-        ) as handler:
-            return handler.mirror_repository()  # Use the new method that handles branching
+        # Lock the clone directory before taking a slot, so waiting for another
+        # mapping of the same source doesn't keep a different repository waiting
+        with _clone_dir_lock(get_clone_dir(source_project_path)), _large_repo_slots:
+            with LargeRepoHandler(
+                source_url,
+                source_project_path,
+                source_token,
+                target_url,
+                target_project_path,
+                target_token,
+                chunk_size=chunk_size,
+                shallow=shallow,
+                keep_temp_dir=keep_temp_dir,
+            ) as handler:
+                return handler.mirror_repository()  # Use the new method that handles branching
     except Exception as e:
         logger.error("Failed to mirror repository: %s", e)
         return False
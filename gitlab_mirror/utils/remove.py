@@ -4,21 +4,84 @@ Utility module for removing GitLab push mirrors based on specified criteria.
 
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
 import gitlab
 
+from gitlab_mirror.core.config import HTTP_POOL_SIZE, configure_http_pool
+from gitlab_mirror.utils.parallel import bounded_map, bulk_gc
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Projects processed concurrently; each costs a few API round trips
+MAX_WORKERS = 16
+
+
+def _find_mirrors_to_remove(
+    project,
+    pattern: Optional[Pattern[str]],
+    remove_failed: bool,
+    remove_all: bool,
+    dry_run: bool,
+) -> Tuple[int, List[Any]]:
+    """
+    List the push mirrors of one project and select those matching the criteria.
+
+    Returns:
+        Tuple of (number of mirrors in the project, mirrors to remove)
+    """
+    # Listed projects already expose the remote mirrors manager, no need to get them again
+    mirrors = project.remote_mirrors.list(iterator=True, per_page=100)
+    project_path = project.path_with_namespace
+    verb = "Would remove" if dry_run else "Removing"
+    mirror_count = 0
+    to_remove = []
+
+    for mirror in mirrors:
+        mirror_count += 1
+        should_remove = False
+        mirror_url = getattr(mirror, "url", "unknown URL")
+
+        # If remove_all is True, remove every mirror
+        if remove_all:
+            should_remove = True
+            logger.info("%s mirror from project %s (remove_all flag)", verb, project_path)
+
+        # If a pattern is provided and the mirror URL matches the pattern
+        elif pattern and pattern.search(mirror_url):
+            should_remove = True
+            logger.info(
+                "Found mirror matching pattern in project %s: %s",
+                project_path,
+                mirror_url,
+            )
+
+        # If remove_failed is True and the mirror has an issue
+        elif remove_failed and (not mirror.enabled or getattr(mirror, "last_error", None)):
+            should_remove = True
+            # The error text is only looked up when it will be logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found failed mirror in project %s: %s",
+                    project_path,
+                    getattr(mirror, "last_error", None) or "disabled",
+                )
+
+        if should_remove:
+            to_remove.append(mirror)
+
+    return mirror_count, to_remove
+
 
 def remove_mirrors(
     gitlab_url: str,
     private_token: str,
-    pattern: Optional[str] = None,
+    pattern: Optional[Union[Pattern[str], str]] = None,
     remove_failed: bool = False,
     remove_all: bool = False,
     dry_run: bool = False,
+    max_workers: int = MAX_WORKERS,
 ) -> Dict[str, Any]:
     """
     Remove push mirrors from GitLab projects based on specified criteria.
@@ -26,20 +89,28 @@ def remove_mirrors(
     Args:
         gitlab_url: Your GitLab instance URL
         private_token: Your GitLab access token
-        pattern: Regular expression pattern to match mirror URLs (optional)
+        pattern: Regular expression (string or compiled) to match mirror URLs (optional);
+            strings are compiled case-insensitively
         remove_failed: If True, removes mirrors with authentication errors
         remove_all: If True, removes all mirrors regardless of other criteria
         dry_run: If True, only counts mirrors that would be removed without actually removing them
+        max_workers: Number of projects processed concurrently
 
     Returns:
         Dictionary with summary statistics
     """
-    # Initialize GitLab connection
+    # Compile the pattern once rather than per mirror URL
+    if pattern and isinstance(pattern, str):
+        pattern = re.compile(pattern, re.IGNORECASE)
+
+    # Initialize GitLab connection, with a connection per worker
     gl = gitlab.Gitlab(url=gitlab_url, private_token=private_token)
+    configure_http_pool(gl.session, max(HTTP_POOL_SIZE, max_workers))
 
     # Get all projects
     logger.info("Fetching all projects from GitLab...")
-    projects = gl.projects.list(all=True)
+    # Paged lazily, so processing starts with the first page
+    projects = gl.projects.list(iterator=True, per_page=100)
 
     mirrors_removed = 0
     would_remove = 0  # Counter for dry_run mode
@@ -49,102 +120,51 @@ def remove_mirrors(
     error_count = 0
     failed_projects = []
 
-    logger.info("Found %d projects to process", len(projects))
+    def process(project) -> Tuple[int, List[Any]]:
+        return _find_mirrors_to_remove(project, pattern, remove_failed, remove_all, dry_run)
 
-    for project in projects:
-        projects_processed += 1
+    # Phase 1: list mirrors and select the ones to remove, several projects at a time
+    to_delete: List[Tuple[str, Any]] = []
+    with bulk_gc():
+        for project, future in bounded_map(process, projects, max_workers):
+            projects_processed += 1
 
-        if projects_processed % 50 == 0:
-            logger.info("Progress: %d/%d projects processed", projects_processed, len(projects))
+            if projects_processed % 50 == 0:
+                logger.info("Progress: %d projects processed", projects_processed)
 
-        try:
-            # Get project with mirror info
-            project_with_mirrors = gl.projects.get(project.id)
-            mirrors = project_with_mirrors.remote_mirrors.list()
+            project_path = project.path_with_namespace
+            try:
+                mirror_count, mirrors = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error processing project %s: %s", project_path, str(e))
+                failed_projects.append({"project": project_path, "error": str(e)})
+                error_count += 1
+                continue
 
-            if mirrors:
+            if mirror_count:
                 projects_with_mirrors += 1
-            else:
-                continue  # Skip projects without mirrors
-
-            project_mirrors_removed = 0
-            project_matches = False
-
-            for mirror in mirrors:
-                should_remove = False
-                mirror_url = mirror.url if hasattr(mirror, "url") else "unknown URL"
-
-                # If remove_all is True, remove every mirror
-                if remove_all:
-                    should_remove = True
-                    logger.info(
-                        "%s mirror from project %s (remove_all flag)",
-                        "Would remove" if dry_run else "Removing",
-                        project.path_with_namespace,
-                    )
-
-                # If a pattern is provided and the mirror URL matches the pattern
-                elif pattern and re.search(pattern, mirror_url, re.IGNORECASE):
-                    should_remove = True
-                    logger.info(
-                        "Found mirror matching pattern in project %s: %s",
-                        project.path_with_namespace,
-                        mirror_url,
-                    )
-
-                # If remove_failed is True and the mirror has an issue
-                elif remove_failed and (
-                    not mirror.enabled or (hasattr(mirror, "last_error") and mirror.last_error)
-                ):
-                    should_remove = True
-                    error_info = mirror.last_error if hasattr(mirror, "last_error") else "disabled"
-                    logger.info(
-                        "Found failed mirror in project %s: %s",
-                        project.path_with_namespace,
-                        error_info,
-                    )
-
-                if should_remove:
-                    project_matches = True
-                    if dry_run:
-                        would_remove += 1
-                        project_mirrors_removed += 1
-                    else:
-                        try:
-                            mirror.delete()
-                            project_mirrors_removed += 1
-                            mirrors_removed += 1
-                            logger.info(
-                                "Successfully removed mirror from %s", project.path_with_namespace
-                            )
-                        except Exception as e:  # pylint: disable=broad-exception-caught
-                            logger.error(
-                                "Error removing mirror from %s: %s",
-                                project.path_with_namespace,
-                                str(e),
-                            )
-                            error_count += 1
-
-            if project_mirrors_removed > 0:
-                if not dry_run:
-                    logger.info(
-                        "Removed %d mirrors from %s",
-                        project_mirrors_removed,
-                        project.path_with_namespace,
-                    )
-
-            if project_matches:
+            if mirrors:
                 matching_projects += 1
+            if dry_run:
+                would_remove += len(mirrors)
+            else:
+                to_delete.extend((project_path, mirror) for mirror in mirrors)
 
+    # Phase 2: delete the selected mirrors concurrently, over the same pooled connections
+    for (project_path, _), future in bounded_map(
+        lambda item: item[1].delete(), to_delete, max_workers
+    ):
+        try:
+            future.result()
+            mirrors_removed += 1
+            logger.info("Successfully removed mirror from %s", project_path)
         except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Error processing project %s: %s", project.path_with_namespace, str(e))
-            failed_projects.append({"project": project.path_with_namespace, "error": str(e)})
+            logger.error("Error removing mirror from %s: %s", project_path, str(e))
             error_count += 1
-            continue
 
     # Generate summary
     result = {
-        "total_projects": len(projects),
+        "total_projects": projects_processed,
         "projects_with_mirrors": projects_with_mirrors,
         "matching_projects": matching_projects,
         "processed_projects": projects_processed,
@@ -156,7 +176,7 @@ def remove_mirrors(
 
     mode_prefix = "DRY RUN - " if dry_run else ""
     logger.info("\n===== %sMIRROR REMOVAL SUMMARY =====", mode_prefix)
-    logger.info("Total projects: %d", len(projects))
+    logger.info("Total projects: %d", projects_processed)
     logger.info("Projects with mirrors: %d", projects_with_mirrors)
     logger.info("Projects with matching mirrors: %d", matching_projects)
 
@@ -5,11 +5,12 @@ Utility module for triggering GitLab push mirror synchronization.
 import csv
 import logging
 import os
-import time
 
 import gitlab
+from gitlab.exceptions import GitlabHttpError
 
-from gitlab_mirror.core.config import get_env_variable
+from gitlab_mirror.core.config import configure_http_pool, get_env_variable
+from gitlab_mirror.utils.parallel import RateLimiter, bounded_map
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -35,31 +36,35 @@ def trigger_mirror_sync(source_gl, project_path):
         for mirror in mirrors:
             logger.info("Processing mirror %s for %s", mirror.id, project_path)
 
-            # Toggle mirror to force update
-            if mirror.enabled:
-                # Disable and re-enable mirror
-                mirror.enabled = False
-                mirror.save()
-                time.sleep(1)  # Small delay
-
-                mirror.enabled = True
-                mirror.save()
-                logger.info("Toggled mirror %s for %s", mirror.id, project_path)
-            else:
-                # Enable disabled mirror
+            if not mirror.enabled:
+                # Enabling a disabled mirror also schedules an update
                 mirror.enabled = True
                 mirror.save()
                 logger.info("Enabled mirror %s for %s", mirror.id, project_path)
+                continue
 
-            # Try to trigger sync via API
+            # Ask GitLab to sync directly; a single request instead of two saves
             try:
                 url = f"/projects/{project.id}/remote_mirrors/{mirror.id}/sync"
-                logger.info("Attempting direct sync trigger for %s", project_path)
                 source_gl.http_post(url)
                 logger.info("Successfully triggered sync via API for mirror %s", mirror.id)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Could not trigger direct sync (may require Premium): %s", e)
-                logger.info("Relying on toggle to trigger sync for %s", project_path)
+                continue
+            except GitlabHttpError as e:
+                if e.response_code not in (403, 404):
+                    raise
+                logger.info(
+                    "Direct sync not available for %s (HTTP %d), toggling mirror instead",
+                    project_path,
+                    e.response_code,
+                )
+
+            # Disable and re-enable the mirror to force an update. save() returns
+            # once GitLab has stored the change, so no delay is needed in between
+            mirror.enabled = False
+            mirror.save()
+            mirror.enabled = True
+            mirror.save()
+            logger.info("Toggled mirror %s for %s", mirror.id, project_path)
 
         return True
 
@@ -71,6 +76,9 @@ def trigger_mirror_sync(source_gl, project_path):
 def process_file(file_path, batch_size=5, delay_between_projects=2):
     """
     Process list of projects from a file.
+
+    Up to batch_size projects are processed concurrently, and a new project is
+    started at most every delay_between_projects seconds.
     """
     # Check if file exists
     if not os.path.exists(file_path):
@@ -86,35 +94,34 @@ def process_file(file_path, batch_size=5, delay_between_projects=2):
     source_token = get_env_variable("SOURCE_GITLAB_TOKEN", required=True)
 
     source_gl = gitlab.Gitlab(url=source_url, private_token=source_token)
+    configure_http_pool(source_gl.session)
 
     # Read projects from file
     projects = []
     logger.info("Reading project paths from %s", file_path)
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            # Try to determine file format
+        with open(file_path, "r", newline="", encoding="utf-8") as f:
+            # Determine the file format from the first line; the file is only
+            # rewound when that line holds data rather than a header
             first_line = f.readline().strip()
-            f.seek(0)  # Reset file pointer
 
             if "," in first_line:  # Assume CSV
                 logger.info("Detected CSV format for %s", file_path)
-                reader = csv.reader(f)
 
                 # Check if first line is header
                 if "source_path" in first_line.lower() or "project" in first_line.lower():
                     logger.info("Skipping header row")
-                    next(reader)
                 else:
-                    f.seek(0)  # Reset if no header
+                    f.seek(0)
 
-                for row in reader:
-                    if row and len(row) >= 1:
-                        projects.append(row[0])  # First column is source_path
+                # First column is source_path
+                projects = [row[0] for row in csv.reader(f) if row]
             else:
                 # Plain text file, one project per line
                 logger.info("Detected text format for %s", file_path)
-                projects = [line.strip() for line in f if line.strip()]
+                f.seek(0)
+                projects = list(filter(None, map(str.strip, f)))
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.error("Error reading file %s: %s", file_path, e)
         return
@@ -129,36 +136,27 @@ def process_file(file_path, batch_size=5, delay_between_projects=2):
     success_count = 0
     failed_projects = []
 
-    # Process in batches
-    for i in range(0, total, batch_size):
-        batch = projects[i : i + batch_size]  # noqa E203
-        logger.info(
-            "Processing batch %d/%d", i // batch_size + 1, (total + batch_size - 1) // batch_size
-        )
-
-        for project_path in batch:
-            logger.info("Triggering mirror sync for %s", project_path)
-            if trigger_mirror_sync(source_gl, project_path):
-                success_count += 1
-            else:
-                failed_projects.append(project_path)
+    # Projects are triggered by batch_size workers at once, while the rate limiter
+    # keeps the overall pace at one project per delay_between_projects seconds
+    limiter = RateLimiter(delay_between_projects)
 
-            # Delay between projects
-            time.sleep(delay_between_projects)
+    def trigger(project_path: str) -> bool:
+        limiter.acquire()
+        logger.info("Triggering mirror sync for %s", project_path)
+        return trigger_mirror_sync(source_gl, project_path)
 
-        # Longer delay between batches
-        if i + batch_size < total:
-            batch_delay = 5
-            logger.info("Batch complete. Pausing for %d seconds before next batch...", batch_delay)
-            time.sleep(batch_delay)
+    for project_path, future in bounded_map(trigger, projects, max(1, batch_size)):
+        if future.result():
+            success_count += 1
+        else:
+            failed_projects.append(project_path)
 
     logger.info("Finished processing: triggered sync for %d/%d projects", success_count, total)
 
     # Export failed projects to a file for another run if needed
     if failed_projects:
-        with open("04-trigger-failed.csv", "w", encoding="utf-8") as f:
-            for project in failed_projects:
-                f.write(f"{project}\n")
+        with open("04-trigger-failed.csv", "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerows([project] for project in failed_projects)
         logger.info(
             "Exported %d failed trigger attempts to 04-trigger-failed.csv", len(failed_projects)
         )
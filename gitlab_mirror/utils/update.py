@@ -2,28 +2,38 @@
 Utility module for updating or removing GitLab push mirrors based on specified criteria.
 """
 
+import csv
+import functools
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
 import gitlab
 from gitlab.exceptions import GitlabError
 
+from gitlab_mirror.core.config import HTTP_POOL_SIZE, configure_http_pool
+from gitlab_mirror.utils.parallel import bounded_map, bulk_gc
+
 # Configure logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Projects processed concurrently; each costs a few API round trips
+MAX_WORKERS = 16
+
+# last_error text of a mirror whose credentials were rejected
+_AUTH_ERR = "HTTP Basic: Access denied"
+
 
+@functools.lru_cache(maxsize=4096)
 def normalize_mirror_url(url: str) -> str:
     """Normalize mirror URL by removing credentials for comparison."""
-    if "@" in url:
-        return url.split("@", 1)[-1]
-    return url
+    _, sep, host_and_path = url.partition("@")
+    return host_and_path if sep else url
 
 
 def is_mirror_failing(mirror) -> bool:
     """Check if mirror is failing with authentication error."""
-    return not mirror.enabled or "HTTP Basic: Access denied" in getattr(mirror, "last_error", "")
+    return not mirror.enabled or _AUTH_ERR in (getattr(mirror, "last_error", "") or "")
 
 
 def update_mirror_auth(
@@ -48,50 +58,48 @@ def update_mirror_auth(
 def process_project_mirrors(
     project,
     new_token: str,
-    pattern: Optional[str] = None,
+    pattern: Optional[Union[Pattern[str], str]] = None,
     update_failed: bool = False,
     old_domain: Optional[str] = None,
     new_domain: Optional[str] = None,
     dry_run: bool = False,
 ) -> Tuple[int, int]:
-    """Process mirrors in a single project - update or remove based on criteria."""
+    """
+    Process mirrors in a single project - update or remove based on criteria.
+
+    Failing to remove a single mirror is logged and skipped. Errors listing the
+    project's mirrors are raised, so the caller can record the project as failed.
+    """
+    if pattern and isinstance(pattern, str):
+        pattern = re.compile(pattern, re.IGNORECASE)
     mirrors_updated, mirrors_removed = 0, 0
-
-    try:
-        mirrors = project.remote_mirrors.list()
-        for mirror in mirrors:
-            mirror_url = normalize_mirror_url(mirror.url)
-            if (pattern and re.search(pattern, mirror_url, re.IGNORECASE)) or (
-                update_failed and is_mirror_failing(mirror)
-            ):
-                logger.info(
-                    "Processing mirror in project %s: %s", project.path_with_namespace, mirror_url
-                )
-                if not dry_run:
-                    if update_mirror_auth(mirror, new_token, old_domain, new_domain):
-                        mirrors_updated += 1
-                    else:
-                        try:
-                            mirror.delete()
-                            mirrors_removed += 1
-                            logger.info(
-                                "Removed failed mirror from project %s", project.path_with_namespace
-                            )
-                        except GitlabError as e:
-                            logger.error(
-                                "Failed to remove mirror from project %s: %s",
-                                project.path_with_namespace,
-                                str(e),
-                            )
-                else:
-                    logger.info(
-                        "[DRY RUN] Would update mirror in project %s", project.path_with_namespace
-                    )
+    project_path = project.path_with_namespace
+
+    # Pages are fetched as the loop reaches them, so work starts with the first
+    mirrors = project.remote_mirrors.list(iterator=True, per_page=100)
+    for mirror in mirrors:
+        mirror_url = normalize_mirror_url(mirror.url)
+        if (pattern and pattern.search(mirror_url)) or (
+            update_failed and is_mirror_failing(mirror)
+        ):
+            logger.info("Processing mirror in project %s: %s", project_path, mirror_url)
+            if not dry_run:
+                if update_mirror_auth(mirror, new_token, old_domain, new_domain):
                     mirrors_updated += 1
-    except GitlabError as e:
-        logger.error(
-            "Error processing mirrors for project %s: %s", project.path_with_namespace, str(e)
-        )
+                else:
+                    try:
+                        mirror.delete()
+                        mirrors_removed += 1
+                        logger.info("Removed failed mirror from project %s", project_path)
+                    except GitlabError as e:
+                        logger.error(
+                            "Failed to remove mirror from project %s: %s",
+                            project_path,
+                            str(e),
+                        )
+            else:
+                logger.info("[DRY RUN] Would update mirror in project %s", project_path)
+                mirrors_updated += 1
 
     return mirrors_updated, mirrors_removed
 
@@ -100,37 +108,49 @@ def update_mirrors(
     gitlab_url: str,
     private_token: str,
     new_mirror_token: str,
-    pattern: Optional[str] = None,
+    pattern: Optional[Union[Pattern[str], str]] = None,
     update_failed: bool = False,
     old_domain: Optional[str] = None,
     new_domain: Optional[str] = None,
     dry_run: bool = False,
+    max_workers: int = MAX_WORKERS,
 ) -> List[Dict[str, Any]]:
     """Update push mirrors in GitLab projects based on specified criteria."""
+    # Compile the pattern once rather than per mirror URL
+    if pattern and isinstance(pattern, str):
+        pattern = re.compile(pattern, re.IGNORECASE)
+
     gl = gitlab.Gitlab(url=gitlab_url, private_token=private_token)
+    configure_http_pool(gl.session, max(HTTP_POOL_SIZE, max_workers))
     total_updated, total_removed, total_projects = 0, 0, 0
     failed_projects = []
 
+    # Listed projects already expose the remote mirrors manager, no need to get them again
+    def process(project) -> Tuple[int, int]:
+        return process_project_mirrors(
+            project,
+            new_mirror_token,
+            pattern,
+            update_failed,
+            old_domain,
+            new_domain,
+            dry_run,
+        )
+
     try:
-        projects = gl.projects.list(iterator=True)
-        for project in projects:
-            total_projects += 1
-            try:
-                project_with_mirrors = gl.projects.get(project.id)
-                updated, removed = process_project_mirrors(
-                    project_with_mirrors,
-                    new_mirror_token,
-                    pattern,
-                    update_failed,
-                    old_domain,
-                    new_domain,
-                    dry_run,
-                )
-                total_updated += updated
-                total_removed += removed
-            except GitlabError as e:
-                logger.error("Error processing project %s: %s", project.path_with_namespace, str(e))
-                failed_projects.append({"project": project.path_with_namespace, "error": str(e)})
+        with bulk_gc():
+            projects = gl.projects.list(iterator=True)
+            # Projects are fetched page by page while earlier ones are processed
+            for project, future in bounded_map(process, projects, max_workers):
+                total_projects += 1
+                try:
+                    updated, removed = future.result()
+                    total_updated += updated
+                    total_removed += removed
+                except GitlabError as e:
+                    project_path = project.path_with_namespace
+                    logger.error("Error processing project %s: %s", project_path, str(e))
+                    failed_projects.append({"project": project_path, "error": str(e)})
     except GitlabError as e:
         logger.error("Failed to list projects: %s", str(e))
         return []
@@ -146,11 +166,11 @@ def update_mirrors(
         for fail in failed_projects[:10]:
             logger.info("- %s: %s", fail["project"], fail["error"])
 
-        with open("05-update-failed-projects.csv", "w", encoding="utf-8") as f:
-            f.write("project,error\n")
-            for fail in failed_projects:
-                sanitized_error = fail["error"].replace(",", ";")
-                f.write(f"{fail['project']}, {sanitized_error}\n")
+        with open("05-update-failed-projects.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["project", "error"])
+            # Error messages with commas, quotes or line breaks are quoted by csv
+            writer.writerows([fail["project"], str(fail["error"])] for fail in failed_projects)
         logger.info(
             "Exported %d failed projects to 05-update-failed-projects.csv", len(failed_projects)
         )
@@ -2,22 +2,57 @@
 Utility module for verifying GitLab project mirroring status.
 """
 
+import csv
+import functools
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Tuple
 
 from gitlab_mirror.core.config import GitLabConfig
 
 logger = logging.getLogger(__name__)
 
+# Mirror checks run concurrently; each is an independent API round trip
+MAX_WORKERS = 8
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize_mirror_url(url: str) -> str:
     """Normalize mirror URL by removing credentials for comparison."""
-    if "@" in url:
-        return url.split("@", 1)[-1]
-    return url
+    _, sep, host_and_path = url.partition("@")
+    return host_and_path if sep else url
+
+
+# Write buffer for the report files, so large reports go out in few system calls
+CSV_BUFFER_SIZE = 1 << 20
+
+
+def _write_csv(path: str, header, rows) -> None:
+    """Write rows (and a header row unless header is None) to a CSV file."""
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if header is not None:
+            writer.writerow(header)
+        writer.writerows(rows)
 
 
 class MirrorVerifier:
+    # Fixed attribute set; the verification loops read these for every project
+    __slots__ = (
+        "source_gl",
+        "target_gl",
+        "project_mappings",
+        "source_projects_cache",
+        "target_projects_cache",
+        "target_domain",
+        "_mirrors_cache",
+        "missing_in_target",
+        "missing_mirrors",
+        "failed_mirrors",
+        "success_count",
+    )
+
     def __init__(self, source_gl: GitLabConfig, target_gl: GitLabConfig, project_mappings):
         """
         Initialize verifier with GitLab connections and project mappings.
@@ -25,7 +60,7 @@ class MirrorVerifier:
         Args:
             source_gl: Source GitLab connection
             target_gl: Target GitLab connection
-            project_mappings: List of tuples (source_path, target_group)
+            project_mappings: List of ProjectMapping (source_path, target_group)
         """
         self.source_gl: GitLabConfig = source_gl
         self.target_gl: GitLabConfig = target_gl
@@ -35,6 +70,15 @@ class MirrorVerifier:
         self.source_projects_cache: Dict[Any, Any] = {}
         self.target_projects_cache: Dict[Any, Any] = {}
 
+        # Host of the target instance, as it appears in mirror URLs
+        parsed_url = target_gl.url.rstrip("/")
+        if "://" in parsed_url:
+            parsed_url = parsed_url.split("://", 1)[1]
+        self.target_domain = parsed_url.split("/", 1)[0]
+
+        # Remote mirrors of each source project by id, for projects mapped more than once
+        self._mirrors_cache: Dict[int, List[Dict[str, Any]]] = {}
+
         # Results
         self.missing_in_target: List[int] = []
         self.missing_mirrors: List[int] = []
@@ -43,13 +87,19 @@ class MirrorVerifier:
 
     def cache_all_projects(self):
         """Cache all projects from both GitLab instances for faster lookups."""
+        # Only ids and paths are needed, so request the simple representation
+        # in pages of 100 (the API maximum) instead of full objects 20 at a time
         logger.info("Caching all source projects...")
-        source_projects = self.source_gl.get_client().projects.list(iterator=True)
+        source_projects = self.source_gl.get_client().projects.list(
+            iterator=True, per_page=100, simple=True
+        )
         for project in source_projects:
             self.source_projects_cache[project.path_with_namespace] = project.id
 
         logger.info("Caching all target projects...")
-        target_projects = self.target_gl.get_client().projects.list(iterator=True)
+        target_projects = self.target_gl.get_client().projects.list(
+            iterator=True, per_page=100, simple=True
+        )
         for project in target_projects:
             self.target_projects_cache[project.path_with_namespace] = project.id
 
@@ -68,100 +118,107 @@ class MirrorVerifier:
             # Preserve original structure
             return source_path
 
-        project_name = source_path.split("/")[-1]
+        project_name = source_path.rpartition("/")[2]
         return f"{target_group}/{project_name}"
 
+    def _list_mirrors(self, source_project_id: int) -> List[Dict[str, Any]]:
+        """List the remote mirrors of a source project, once per run."""
+        mirrors = self._mirrors_cache.get(source_project_id)
+        if mirrors is None:
+            # List the mirrors by project id directly; fetching the project first
+            # would only add a request. Mirrors come back as plain dicts
+            mirrors = self.source_gl.get_client().http_list(
+                f"/projects/{source_project_id}/remote_mirrors", get_all=True
+            )
+            self._mirrors_cache[source_project_id] = mirrors
+        return mirrors
+
     def check_mirror_exists(self, source_project_id: int, target_path: str) -> Tuple[bool, str]:
         """
         Check if mirror from source to target exists and is working.
         """
         try:
-            # Get the proper GitLab client
-            source_client = self.source_gl.get_client()
-            project = source_client.projects.get(source_project_id)
-            mirrors = project.remote_mirrors.list()
-
-            # Extract domain more carefully
-            parsed_url = self.target_gl.url.rstrip("/")
-            if "://" in parsed_url:
-                parsed_url = parsed_url.split("://", 1)[1]
-            if "/" in parsed_url:
-                target_domain = parsed_url.split("/", 1)[0]
-            else:
-                target_domain = parsed_url
-
-            expected_mirror_path = f"{target_domain}/{target_path}.git"
+            mirrors = self._list_mirrors(source_project_id)
+
+            expected_mirror_path = f"{self.target_domain}/{target_path}.git"
 
             # Log for debugging
-            logger.debug(f"Looking for mirror with path: {expected_mirror_path}")
+            logger.debug("Looking for mirror with path: %s", expected_mirror_path)
             for mirror in mirrors:
-                mirror_url = normalize_mirror_url(mirror.url)
-                logger.debug(f"Found mirror URL: {mirror_url}")
+                mirror_url = normalize_mirror_url(mirror["url"])
+                logger.debug("Found mirror URL: %s", mirror_url)
 
                 # More precise comparison
                 if mirror_url.endswith(expected_mirror_path):
                     # Mirror exists, check if it's working
-                    if not mirror.enabled or (hasattr(mirror, "last_error") and mirror.last_error):
-                        return (
-                            True,
-                            (
-                                mirror.last_error
-                                if hasattr(mirror, "last_error")
-                                else "Mirror is disabled"
-                            ),
-                        )  # noqa: E501
+                    last_error = mirror.get("last_error")
+                    if not mirror.get("enabled") or last_error:
+                        return True, last_error or "Mirror is disabled"
                     return True, ""
 
             # No matching mirror found
-            logger.warning(f"No mirror found matching {expected_mirror_path}")
+            logger.warning("No mirror found matching %s", expected_mirror_path)
             return False, "No mirror configured"
 
         except Exception as e:
-            logger.exception(f"Error checking mirror: {e}")
+            logger.exception("Error checking mirror: %s", e)
             return False, str(e)
 
     def verify_all_projects(self):
         """Verify that all projects from mappings are properly mirrored."""
         self.cache_all_projects()
         total = len(self.project_mappings)
-        processed = 0
-        skipped = 0
-
-        logger.info(f"Starting verification of {total} projects...")
-
-        for index, mapping in enumerate(self.project_mappings):
-            source_path = mapping.source_path
-            target_group = mapping.target_group
-            if index % 50 == 0:
-                logger.info(f"Progress: {index}/{total}")
-
-            target_path = self.get_target_path(source_path, target_group)
-
-            # Check if source project exists
-            if source_path not in self.source_projects_cache:
-                # Skip projects that don't exist in source
-                skipped += 1
-                continue
-
-            processed += 1
-
-            # Check if target project exists
-            if target_path not in self.target_projects_cache:
-                self.missing_in_target.append((source_path, target_path, target_group))
-                continue
-
-            # Check if mirror exists and is working
-            source_id = self.source_projects_cache[source_path]
-            mirror_exists, error = self.check_mirror_exists(source_id, target_path)
-
-            if not mirror_exists:
-                self.missing_mirrors.append((source_path, target_path, target_group))
-            elif error:
-                self.failed_mirrors.append((source_path, target_path, error, target_group))
-            else:
-                self.success_count += 1
-
-        logger.info(f"Processed {processed} projects, skipped {skipped} projects missing in source")
+        logger.info("Starting verification of %d projects...", total)
+
+        # Resolve paths from the caches first; only mirror checks need the API.
+        # Projects that don't exist in source are skipped; target paths were
+        # derived once when the mappings were loaded, the same way as get_target_path
+        source_cache = self.source_projects_cache
+        found = [
+            (mapping.source_path, mapping.target_path, mapping.target_group)
+            for mapping in self.project_mappings
+            if mapping.source_path in source_cache
+        ]
+        processed = len(found)
+        skipped = total - processed
+
+        # Split by whether the target project exists; only existing ones need a
+        # mirror check
+        target_cache = self.target_projects_cache
+        self.missing_in_target.extend(item for item in found if item[1] not in target_cache)
+        to_check = [
+            (source_path, target_path, target_group, source_cache[source_path])
+            for source_path, target_path, target_group in found
+            if target_path in target_cache
+        ]
+
+        # Check if mirrors exist and are working, several API requests at a time;
+        # executor.map keeps the results in mapping order for the reports
+        add_missing_mirror = self.missing_mirrors.append
+        add_failed_mirror = self.failed_mirrors.append
+        success_count = 0
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda item: self.check_mirror_exists(item[3], item[1]), to_check
+            )
+            for index, ((source_path, target_path, target_group, _), result) in enumerate(
+                zip(to_check, results)
+            ):
+                if index % 50 == 0:
+                    logger.info("Progress: %d/%d mirrors checked", index, len(to_check))
+
+                mirror_exists, error = result
+                if not mirror_exists:
+                    add_missing_mirror((source_path, target_path, target_group))
+                elif error:
+                    add_failed_mirror((source_path, target_path, error, target_group))
+                else:
+                    success_count += 1
+        self.success_count += success_count
+
+        logger.info(
+            "Processed %d projects, skipped %d projects missing in source", processed, skipped
+        )
 
     def print_report(self):
         """Print verification report."""
@@ -173,29 +230,26 @@ class MirrorVerifier:
         )
 
         logger.info("\n===== MIRROR VERIFICATION REPORT =====")
-        logger.info(f"Total projects processed: {total_processed}")
-        logger.info(f"Successfully mirrored: {self.success_count}")
-
-        if self.missing_in_target:
-            logger.warning(f"Projects missing in target ({len(self.missing_in_target)}): ")
-            for source, target, _ in self.missing_in_target[:10]:
-                logger.warning(f" - {source} -> {target}")
-            if len(self.missing_in_target) > 10:
-                logger.warning(f"  ... and {len(self.missing_in_target) - 10} more")
-
-        if self.missing_mirrors:
-            logger.warning(f"Projects without mirrors ({len(self.missing_mirrors)}): ")
-            for source, target, _ in self.missing_mirrors[:10]:
-                logger.warning(f" - {source} -> {target}")
-            if len(self.missing_mirrors) > 10:
-                logger.warning(f"  ... and {len(self.missing_mirrors) - 10} more")
-
-        if self.failed_mirrors:
-            logger.warning(f"Projects with failed mirrors ({len(self.failed_mirrors)}): ")
-            for source, target, error, _ in self.failed_mirrors[:10]:
-                logger.warning(f" - {source} -> {target}: {error}")
-            if len(self.failed_mirrors) > 10:
-                logger.warning(f"  ... and {len(self.failed_mirrors) - 10} more")
+        logger.info("Total projects processed: %d", total_processed)
+        logger.info("Successfully mirrored: %d", self.success_count)
+
+        # The listings below only log, so skip building them when warnings are off
+        if logger.isEnabledFor(logging.WARNING):
+            # (title, results, format of an entry built from its leading fields)
+            listings = (
+                ("Projects missing in target", self.missing_in_target, " - %s -> %s"),
+                ("Projects without mirrors", self.missing_mirrors, " - %s -> %s"),
+                ("Projects with failed mirrors", self.failed_mirrors, " - %s -> %s: %s"),
+            )
+            for title, results, entry_format in listings:
+                if not results:
+                    continue
+                logger.warning("%s (%d): ", title, len(results))
+                field_count = entry_format.count("%s")
+                for result in results[:10]:
+                    logger.warning(entry_format, *result[:field_count])
+                if len(results) > 10:
+                    logger.warning("  ... and %d more", len(results) - 10)
 
         # Export detailed reports to files if there are issues
         if self.missing_in_target or self.missing_mirrors or self.failed_mirrors:
@@ -204,56 +258,47 @@ class MirrorVerifier:
     def export_reports(self):
         """Export detailed reports to CSV files with numerical prefixes."""
         if self.missing_in_target:
-            with open("01-missing-in-target.csv", "w") as f:
-                f.write("source_path,target_path\n")
-                for source, target, _ in self.missing_in_target:
-                    f.write(f"{source}, {target}\n")
+            _write_csv(
+                "01-missing-in-target.csv",
+                ["source_path", "target_path"],
+                ((source, target) for source, target, _ in self.missing_in_target),
+            )
             logger.info("Exported missing target projects to 01-missing-in-target.csv")
 
         if self.missing_mirrors:
-            with open("02-missing-mirrors.csv", "w") as f:
-                f.write("source_path,target_path\n")
-                for source, target, _ in self.missing_mirrors:
-                    f.write(f"{source}, {target}\n")
+            _write_csv(
+                "02-missing-mirrors.csv",
+                ["source_path", "target_path"],
+                ((source, target) for source, target, _ in self.missing_mirrors),
+            )
             logger.info("Exported missing mirrors to 02-missing-mirrors.csv")
 
         if self.failed_mirrors:
-            with open("03-failed-mirrors.csv", "w") as f:
-                f.write("source_path,target_path,error\n")
-                for source, target, error, _ in self.failed_mirrors:
-                    # Replace commas in error message to avoid CSV issues
-                    sanitized_error = error.replace(",", ";")
-                    f.write(f"{source}, {target}, {sanitized_error}\n")
+            # Error messages with commas, quotes or line breaks are quoted by csv
+            _write_csv(
+                "03-failed-mirrors.csv",
+                ["source_path", "target_path", "error"],
+                ((source, target, error) for source, target, error, _ in self.failed_mirrors),
+            )
             logger.info("Exported failed mirrors to 03-failed-mirrors.csv")
 
-        # Generate fix.csv with the format matching projects.csv
-        fix_projects = []
-
-        # Add projects missing in target
-        for source_path, _, target_group in self.missing_in_target:
-            fix_projects.append((source_path, target_group))
-
-        # Add projects without mirrors
-        for source_path, _, target_group in self.missing_mirrors:
-            fix_projects.append((source_path, target_group))
-
-        # Add projects with failed mirrors
-        for source_path, _, _, target_group in self.failed_mirrors:
-            fix_projects.append((source_path, target_group))
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_fix_projects = []
-        for item in fix_projects:
-            if item not in seen:
-                seen.add(item)
-                unique_fix_projects.append(item)
+        # Generate fix.csv with the format matching projects.csv: projects missing
+        # in target, without mirrors and with failed mirrors, in that order.
+        # dict.fromkeys removes duplicates while preserving order
+        unique_fix_projects = list(
+            dict.fromkeys(
+                itertools.chain(
+                    ((source, group) for source, _, group in self.missing_in_target),
+                    ((source, group) for source, _, group in self.missing_mirrors),
+                    ((source, group) for source, _, _, group in self.failed_mirrors),
+                )
+            )
+        )
 
         # Write fix.csv
         if unique_fix_projects:
-            with open("00-fix.csv", "w") as f:
-                for source_path, target_group in unique_fix_projects:
-                    f.write(f"{source_path}, {target_group}\n")
+            _write_csv("00-fix.csv", None, unique_fix_projects)
             logger.info(
-                f"Exported {len(unique_fix_projects)} projects to 00-fix.csv in projects.csv format"
+                "Exported %d projects to 00-fix.csv in projects.csv format",
+                len(unique_fix_projects),
             )
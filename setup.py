@@ -23,11 +23,15 @@ setup(
         "python-gitlab>=5.3,<6.0",
         "python-dotenv>=1.0,<2.0",
         "cryptography>=44.0,<45.0",
-        "pydantic>=2.0.0,<3.0.0",
-        "pandas>=2.0.0,<3.0.0",
         "setuptools>=75.8,<76.0",
     ],
     extras_require={
+        "fast-csv": [
+            "pyarrow>=12.0",
+        ],
+        "fast-json": [
+            "orjson>=3.6",
+        ],
         "dev": [
             "black>=23.3.0",
             "isort>=5.12.0",
@@ -43,7 +47,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "gitlab-mirror=gitlab_mirror.cli.main:main",
+            "gitlab-mirror=gitlab_mirror.cli.__main__:main",
             "gitlab-mirror-verify=gitlab_mirror.cli.commands.verify_command:main",
             "gitlab-mirror-update=gitlab_mirror.cli.commands.update_command:main",
             "gitlab-mirror-trigger=gitlab_mirror.cli.commands.trigger_command:main",